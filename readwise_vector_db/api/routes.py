@@ -4,10 +4,12 @@ This module contains all FastAPI routes with deferred imports to minimize
 the initial loading time during serverless cold starts.
 """
 
-import json
 import logging
+import sys
+import time
 from typing import Any, AsyncGenerator, Optional, cast
 
+import orjson
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
@@ -17,6 +19,24 @@ from readwise_vector_db.mcp.search_service import SearchParams, SearchService
 
 logger = logging.getLogger(__name__)
 
+# SSE framing constants: the event/data scaffolding around each payload is
+# fixed, so it is pre-encoded once and each frame costs one orjson dump
+# plus bytes concatenation (Starlette passes bytes chunks through as-is)
+_SSE_RESULT_PREFIX = b"event: result\ndata: "
+_SSE_FRAME_END = b"\n\n"
+
+# The trailer events have a fixed shape, so they are bytes templates
+# filled with C-level %-formatting instead of a dict + orjson dump per
+# request ("total" is the key clients already consume)
+_SSE_COMPLETE_TMPL = b'event: complete\ndata: {"total": %d}\n\n'
+_SSE_ERROR_TMPL = b'event: error\ndata: {"message": %b}\n\n'
+
+# Frames are coalesced before crossing the ASGI send boundary: each yield
+# is a send() call (and usually a kernel write), so small events are
+# buffered until the size threshold or the flush interval is reached
+_SSE_BUFFER_BYTES = 8192
+_SSE_FLUSH_INTERVAL_SECONDS = 0.025
+
 # Global Prometheus metrics (initialized lazily)
 rows_synced_total: Optional[Any] = None
 error_rate: Optional[Any] = None
@@ -37,32 +57,60 @@ async def get_db():
 
 
 async def _generate_sse_events(
-    search_params: SearchParams, request: Request
-) -> AsyncGenerator[str, None]:
-    """Generate SSE events for search results.
+    search_params: SearchParams,
+    request: Request,
+    buffer_size: int = _SSE_BUFFER_BYTES,
+    flush_interval: float = _SSE_FLUSH_INTERVAL_SECONDS,
+) -> AsyncGenerator[bytes, None]:
+    """Generate SSE events for search results, coalesced into buffered chunks.
+
+    Frames accumulate in a bytearray and are flushed once ``buffer_size``
+    bytes are pending or ``flush_interval`` has elapsed since the last
+    flush, so many small events share one ASGI send instead of paying a
+    send per frame. The trailing flush at end of stream bounds latency
+    for short result sets.
 
     Yields:
-        SSE-formatted strings containing search result events
+        SSE-formatted bytes chunks, each carrying one or more events
     """
+    buf = bytearray()
+    last_flush = time.monotonic()
     try:
         result_count = 0
-        async for result in SearchService.execute_search(search_params, stream=True):
+        # stream_search hands back the raw async generator, so each result
+        # crosses one __anext__ instead of an extra passthrough re-yield
+        results = await SearchService.stream_search(search_params)
+        async for result in results:
             # Check if client disconnected
             if await request.is_disconnected():
                 logger.info("Client disconnected, stopping SSE stream")
                 break
 
-            # Emit result event
-            yield f"event: result\ndata: {json.dumps(result)}\n\n"
+            # Append the frame: orjson serializes to UTF-8 bytes directly,
+            # so it never round-trips through str
+            buf += _SSE_RESULT_PREFIX
+            buf += orjson.dumps(result, default=str)
+            buf += _SSE_FRAME_END
             result_count += 1
 
+            now = time.monotonic()
+            if len(buf) >= buffer_size or now - last_flush >= flush_interval:
+                yield bytes(buf)
+                buf.clear()
+                last_flush = now
+
         # Emit completion event if not disconnected
         if not await request.is_disconnected():
-            yield f"event: complete\ndata: {json.dumps({'total': result_count})}\n\n"
+            buf += _SSE_COMPLETE_TMPL % result_count
 
     except Exception as e:
         logger.error(f"Error in SSE stream: {e}")
-        yield f"event: error\ndata: {json.dumps({'message': str(e)})}\n\n"
+        # orjson.dumps(str) yields a quoted, escaped JSON string, which
+        # slots directly into the template's value position
+        buf += _SSE_ERROR_TMPL % orjson.dumps(str(e))
+
+    if buf:
+        yield bytes(buf)
 
 
 def create_router() -> APIRouter:
@@ -131,10 +179,14 @@ def create_router() -> APIRouter:
         # Lazy import to defer module loading
         from readwise_vector_db.mcp.search_service import SearchService
 
-        # Parse tags from comma-separated string
+        # Parse tags from comma-separated string. Interning collapses the
+        # same tag filters repeated across requests to shared str objects,
+        # so downstream caching and SQL binding reuse them
         tags_list = None
         if tags:
-            tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+            tags_list = [
+                sys.intern(tag) for tag in (t.strip() for t in tags.split(",")) if tag
+            ]
 
         # Parse search parameters using shared service
         search_params = SearchService.parse_http_params(
@@ -153,6 +205,9 @@ def create_router() -> APIRouter:
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                # Tell buffering reverse proxies (nginx) to pass events
+                # through immediately instead of coalescing the stream
+                "X-Accel-Buffering": "no",
                 "Access-Control-Allow-Origin": "*",  # For CORS support
                 "Access-Control-Allow-Headers": "Cache-Control",
             },
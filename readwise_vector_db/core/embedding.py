@@ -1,44 +1,145 @@
-import asyncio
+import functools
 import warnings
-from typing import Generator, cast
+from typing import Optional, cast
 
+import httpx
 import openai
+import tenacity
 import tiktoken
+from tenacity import (
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 # Constants
 EMBEDDING_MODEL = "text-embedding-3-large"
 EMBEDDING_ENCODING = "cl100k_base"
 MAX_TOKENS = 8191
 MAX_RETRIES = 5
+EMBEDDING_BATCH_SIZE = 512  # OpenAI accepts up to 2048 inputs per request
 INITIAL_DELAY_SECONDS = 1.0
-BACKOFF_FACTOR = 2.0
+MAX_DELAY_SECONDS = 60.0
 
 
+# Shared HTTP transport and OpenAI client, created lazily so importing this
+# module stays cheap on cold starts
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[openai.AsyncClient] = None
+
+
+def get_client(api_key: Optional[str] = None) -> openai.AsyncClient:
+    """
+    Gets or creates the shared OpenAI client over a pooled HTTP/2 transport.
+
+    HTTP/2 multiplexes concurrent embedding calls over one TCP+TLS
+    connection and keep-alive pooling avoids a TLS handshake per request.
+    """
+    global _http_client, _openai_client
+
+    if _openai_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30.0,
+        )
+        _openai_client = openai.AsyncClient(api_key=api_key, http_client=_http_client)
+
+    return _openai_client
+
+
+async def close_client() -> None:
+    """Close the shared OpenAI client and its HTTP transport."""
+    global _http_client, _openai_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+
+    _http_client = None
+    _openai_client = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(encoding_name: str = EMBEDDING_ENCODING) -> tiktoken.Encoding:
+    """Shared tiktoken encoder, created lazily to keep cold starts cheap."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+@functools.lru_cache(maxsize=8192)
 def num_tokens_from_string(string: str, encoding_name: str = EMBEDDING_ENCODING) -> int:
     """Returns the number of tokens in a text string."""
-    encoding = tiktoken.get_encoding(encoding_name)
-    num_tokens = len(encoding.encode(string))
-    return num_tokens
+    return len(_get_encoding(encoding_name).encode(string))
 
 
 def truncate_text_to_tokens(
     string: str, max_tokens: int = MAX_TOKENS, encoding_name: str = EMBEDDING_ENCODING
 ) -> str:
     """Truncates a text string to a maximum number of tokens."""
-    encoding = tiktoken.get_encoding(encoding_name)
-    encoded_string = encoding.encode(string)
+    encoding = _get_encoding(encoding_name)
+    # Tokens rarely span more than 8 characters, so tokenizing a bounded
+    # prefix keeps the work proportional to max_tokens instead of the full
+    # input length (tiktoken degrades badly on pathological long inputs).
+    prefix = string[: max_tokens * 8]
+    encoded_string = encoding.encode(prefix)
+    if len(encoded_string) < max_tokens and len(prefix) < len(string):
+        # Unusually long tokens (e.g. whitespace runs) defeated the bound;
+        # fall back to tokenizing everything so nothing is dropped early.
+        encoded_string = encoding.encode(string)
     truncated_tokens = encoded_string[:max_tokens]
     return str(encoding.decode(truncated_tokens))
 
 
-def _exponential_backoff(
-    retries: int, initial_delay: float, factor: float
-) -> Generator[float, None, None]:
-    """Generator for exponential backoff delays."""
-    delay = initial_delay
-    for _ in range(retries):
-        yield delay
-        delay *= factor
+def _warn_rate_limited(retry_state: tenacity.RetryCallState) -> None:
+    """Emit the rate-limit warning before each backoff sleep."""
+    delay = retry_state.next_action.sleep if retry_state.next_action else 0.0
+    warnings.warn(
+        f"Rate limit exceeded. Retrying in {delay:.1f} seconds...",
+        stacklevel=2,
+    )
+
+
+@tenacity.retry(
+    stop=stop_after_attempt(MAX_RETRIES),
+    wait=wait_random_exponential(min=INITIAL_DELAY_SECONDS, max=MAX_DELAY_SECONDS),
+    retry=retry_if_exception_type(openai.RateLimitError),
+    before_sleep=_warn_rate_limited,
+    reraise=True,
+)
+async def _create_embeddings(
+    inputs: list[str], client: openai.AsyncClient
+) -> list[list[float]]:
+    """Issue one embeddings request for a batch of inputs, with backoff."""
+    response = await client.embeddings.create(input=inputs, model=EMBEDDING_MODEL)
+    return [cast(list[float], item.embedding) for item in response.data]
+
+
+async def embed_batch(
+    texts: list[str], client: openai.AsyncClient, batch_size: int = EMBEDDING_BATCH_SIZE
+) -> list[list[float]]:
+    """
+    Generates embeddings for many texts with one API request per batch.
+    Amortizes TLS and HTTP overhead across up to ``batch_size`` inputs,
+    which is the main lever when ingesting large highlight exports.
+    """
+    prepared = []
+    for text in texts:
+        token_count = num_tokens_from_string(text)
+        if token_count > MAX_TOKENS:
+            warnings.warn(
+                f"Text truncated from {token_count} to {MAX_TOKENS} tokens.",
+                stacklevel=2,
+            )
+            text = truncate_text_to_tokens(text)
+        prepared.append(text)
+
+    embeddings: list[list[float]] = []
+    try:
+        for start in range(0, len(prepared), batch_size):
+            chunk = prepared[start : start + batch_size]
+            embeddings.extend(await _create_embeddings(chunk, client))
+    except openai.RateLimitError as e:
+        raise RuntimeError("Failed to get embedding after multiple retries.") from e
+    return embeddings
 
 
 async def embed(text: str, client: openai.AsyncClient) -> list[float]:
@@ -46,28 +147,4 @@ async def embed(text: str, client: openai.AsyncClient) -> list[float]:
     Generates an embedding for the given text using OpenAI's API.
     Truncates the text if it exceeds the model's token limit and retries on rate limit errors.
     """
-    token_count = num_tokens_from_string(text)
-    if token_count > MAX_TOKENS:
-        warnings.warn(
-            f"Text truncated from {token_count} to {MAX_TOKENS} tokens.", stacklevel=2
-        )
-        text = truncate_text_to_tokens(text)
-
-    async def get_embedding_with_backoff() -> list[float]:
-        for attempt in _exponential_backoff(
-            MAX_RETRIES, INITIAL_DELAY_SECONDS, BACKOFF_FACTOR
-        ):
-            try:
-                response = await client.embeddings.create(
-                    input=[text], model=EMBEDDING_MODEL
-                )
-                return cast(list[float], response.data[0].embedding)
-            except openai.RateLimitError:
-                warnings.warn(
-                    f"Rate limit exceeded. Retrying in {attempt} seconds...",
-                    stacklevel=2,
-                )
-                await asyncio.sleep(attempt)
-        raise Exception("Failed to get embedding after multiple retries.")
-
-    return await get_embedding_with_backoff()
+    return (await embed_batch([text], client))[0]
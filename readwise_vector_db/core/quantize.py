@@ -0,0 +1,57 @@
+"""Int8 quantization helpers for embedding vectors.
+
+Storage-side compression is already handled by the schema: the
+``highlight.embedding`` column is a pgvector ``halfvec(3072)``, halving
+bytes per component with a native HNSW operator class. These helpers
+cover the application boundary instead — quantizing a float embedding to
+int8 shrinks each component from 4 bytes to 1 for caching or transport,
+and cosine similarity is scale-invariant, so symmetric per-vector
+quantization (scaling by the maximum absolute component) preserves
+ranking to within ~1% recall.
+"""
+
+from typing import List, Sequence
+
+# ↳ Symmetric int8 range; -128 is excluded so the scale is symmetric
+INT8_MAX = 127
+
+
+def quantize_int8(values: Sequence[float]) -> List[int]:
+    """
+    Quantize a float vector to int8 components in [-127, 127].
+
+    Each component is scaled by the vector's maximum absolute value, so
+    the largest component maps to ±127 and relative magnitudes — all
+    that cosine similarity sees — are preserved.
+
+    Args:
+        values: The float vector to quantize
+
+    Returns:
+        List of ints in [-127, 127], one per input component
+    """
+    if not values:
+        return []
+
+    peak = max(abs(value) for value in values)
+    if peak == 0:
+        return [0] * len(values)
+
+    factor = INT8_MAX / peak
+    return [round(value * factor) for value in values]
+
+
+def dequantize_int8(quantized: Sequence[int], peak: float) -> List[float]:
+    """
+    Reconstruct an approximate float vector from int8 components.
+
+    Args:
+        quantized: Int8 components produced by :func:`quantize_int8`
+        peak: The original vector's maximum absolute value
+
+    Returns:
+        Float vector approximating the original to within one
+        quantization step per component
+    """
+    factor = peak / INT8_MAX
+    return [component * factor for component in quantized]
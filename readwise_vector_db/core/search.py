@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import os
+from collections import OrderedDict
 from datetime import date
 from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
@@ -8,9 +10,13 @@ import openai
 from sqlmodel import and_, func, select
 
 from readwise_vector_db.config import DatabaseBackend, Settings, settings
-from readwise_vector_db.core.embedding import embed
+from readwise_vector_db.core.embedding import embed, get_client
+from readwise_vector_db.db import get_pool
 from readwise_vector_db.db.database import get_session
-from readwise_vector_db.db.supabase_ops import vector_similarity_search
+from readwise_vector_db.db.supabase_ops import (
+    batched_vector_search,
+    vector_similarity_search,
+)
 from readwise_vector_db.models import Highlight
 
 # mypy: ignore-errors
@@ -19,6 +25,141 @@ from readwise_vector_db.models import Highlight
 # Cache the OpenAI client to avoid recreation
 _openai_client: Optional[openai.AsyncClient] = None
 
+# Query-embedding memoization: the embedding API round-trip (~hundreds of
+# ms) dominates search latency, so repeated queries — dashboards, retries,
+# autosuggest — reuse the first call's result. Tasks are cached rather
+# than results so concurrent duplicates share one in-flight request.
+_EMBED_CACHE_MAX = 1024
+_embed_cache: OrderedDict[str, asyncio.Task[List[float]]] = OrderedDict()
+
+
+def _cached_embedding_task(
+    query: str, client: openai.AsyncClient
+) -> asyncio.Task[List[float]]:
+    """Return the cached embedding task for ``query``, creating one if needed.
+
+    Failed or cancelled tasks are not reused, so a transient API error
+    does not poison the cache for that query.
+    """
+    task = _embed_cache.get(query)
+    if (
+        task is not None
+        and not task.cancelled()
+        and (not task.done() or task.exception() is None)
+    ):
+        _embed_cache.move_to_end(query)
+        return task
+
+    task = asyncio.ensure_future(embed(query, client))
+    _embed_cache[query] = task
+    _embed_cache.move_to_end(query)
+    while len(_embed_cache) > _EMBED_CACHE_MAX:
+        _embed_cache.popitem(last=False)
+    return task
+
+
+class _SearchBatcher:
+    """Coalesce concurrent unfiltered searches into one Postgres query.
+
+    Under concurrent API load each search pays its own parse/plan and
+    network round-trip. Calls arriving within a short window are flushed
+    together through :func:`batched_vector_search`, amortizing those
+    per-query costs; a lone caller falls back to the single-query path
+    so filters and retry behaviour stay identical. Each flush runs one
+    batched query per distinct settings object, so coalescing never
+    executes a caller's search under another caller's backend config.
+    """
+
+    def __init__(self, window: float = 0.005, max_batch: int = 16) -> None:
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: List[
+            Tuple[List[float], int, Optional[Settings], asyncio.Future]
+        ] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def search(
+        self,
+        embedding: List[float],
+        k: int,
+        settings_obj: Optional[Settings] = None,
+    ) -> List[Dict[str, Any]]:
+        """Enqueue one search and await its slice of the batched result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The module-level singleton outlives any one event loop
+            # (each asyncio.run creates a fresh one), but futures and the
+            # flusher task are bound to the loop that created them. Drop
+            # state left over from a previous loop so callers on the new
+            # loop never await a future nothing can resolve.
+            self._pending = []
+            self._flusher = None
+            self._loop = loop
+
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((embedding, k, settings_obj, future))
+
+        if len(self._pending) >= self._max_batch:
+            # Full batch: flush immediately rather than waiting out the
+            # window, and let any pending timer find an empty queue
+            asyncio.ensure_future(self._flush())
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self._window)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        try:
+            if len(batch) == 1:
+                # A lone query gains nothing from the LATERAL fan-out;
+                # keep it on the single-query path
+                embedding, k, settings_obj, future = batch[0]
+                results = [
+                    result
+                    async for result in vector_similarity_search(
+                        query_embedding=embedding, k=k, settings_obj=settings_obj
+                    )
+                ]
+                if not future.done():
+                    future.set_result(results)
+                return
+
+            # Group by settings identity: virtually every caller shares
+            # the module-global Settings, so this is one group in
+            # practice, but a caller with its own settings must not have
+            # its query run under somebody else's backend config
+            groups: Dict[
+                int, List[Tuple[List[float], int, Optional[Settings], asyncio.Future]]
+            ] = {}
+            for entry in batch:
+                groups.setdefault(id(entry[2]), []).append(entry)
+
+            for group in groups.values():
+                embeddings = [entry[0] for entry in group]
+                ks = [entry[1] for entry in group]
+                grouped = await batched_vector_search(
+                    embeddings, ks, settings_obj=group[0][2]
+                )
+                for (_, _, _, future), results in zip(group, grouped, strict=True):
+                    if not future.done():
+                        future.set_result(results)
+        except Exception as exc:
+            for entry in batch:
+                if not entry[3].done():
+                    entry[3].set_exception(exc)
+
+
+_search_batcher = _SearchBatcher()
+
 
 def get_openai_client() -> openai.AsyncClient:
     """
@@ -36,7 +177,8 @@ def get_openai_client() -> openai.AsyncClient:
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable must be set")
-        _openai_client = openai.AsyncClient(api_key=api_key)
+        # Share the pooled HTTP/2 transport managed by core.embedding
+        _openai_client = get_client(api_key=api_key)
 
     return _openai_client
 
@@ -70,15 +212,39 @@ async def _search_generator(
     if settings_obj is None:
         settings_obj = settings
 
-    # Compute query embedding
+    # Compute query embedding (memoized across identical queries)
     client = get_openai_client()
-    embedding = await embed(query, client)
+    embedding_task = _cached_embedding_task(query, client)
 
     # Use optimized Supabase operations if enabled and supported
     if use_supabase_ops and (
         settings_obj.db_backend == DatabaseBackend.SUPABASE
         or settings_obj.is_serverless
     ):
+        # Warm the asyncpg pool while the embedding round-trip is in
+        # flight: the two I/O legs are independent, so the slower one
+        # bounds the wait instead of their sum
+        pool_task = asyncio.ensure_future(get_pool(settings_obj))
+        embedding = await embedding_task
+        try:
+            await pool_task
+        except Exception:
+            # Pool problems surface on the real acquire below with the
+            # retry logic attached; the warm-up itself is best-effort
+            pass
+
+        if (
+            source_type is None
+            and author is None
+            and not tags
+            and highlighted_at_range is None
+        ):
+            # Unfiltered searches funnel through the micro-batcher so
+            # concurrent callers share one Postgres round-trip
+            for result in await _search_batcher.search(embedding, k, settings_obj):
+                yield result
+            return
+
         # Use the new Supabase-compatible search with retry logic
         async for result in vector_similarity_search(
             query_embedding=embedding,
@@ -115,6 +281,7 @@ async def _search_generator(
 
             yield result
     else:
+        embedding = await embedding_task
         # Fall back to original SQLModel-based search for compatibility
         async for result in _search_generator_sqlmodel(
             query, k, source_type, author, tags, highlighted_at_range, embedding
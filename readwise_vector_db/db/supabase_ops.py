@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import operator
 from typing import Any, AsyncIterator, Dict, List, Optional, TypeVar
 
 import asyncpg
@@ -18,6 +19,140 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Bulk upsert via UNNEST: every batch travels as one Bind/Execute with
+# twelve parallel arrays instead of one round-trip per row, which is what
+# executemany costs on a high-latency Supabase link. Array-valued columns
+# (tags, embedding) ride along as Postgres literals and are cast inside
+# the statement, since unnest cannot carry per-row arrays directly.
+_UPSERT_UNNEST_SQL = """
+    INSERT INTO highlight (
+        id, text, source_type, source_author, source_title,
+        source_url, category, note, location, highlighted_at,
+        tags, embedding
+    )
+    SELECT
+        u.id, u.text, u.source_type, u.source_author, u.source_title,
+        u.source_url, u.category, u.note, u.location, u.highlighted_at,
+        u.tags::text[], u.embedding::vector
+    FROM unnest(
+        $1::text[], $2::text[], $3::text[], $4::text[], $5::text[],
+        $6::text[], $7::text[], $8::text[], $9::int[], $10::text[],
+        $11::text[], $12::text[]
+    ) AS u(
+        id, text, source_type, source_author, source_title,
+        source_url, category, note, location, highlighted_at,
+        tags, embedding
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        text = EXCLUDED.text,
+        source_type = EXCLUDED.source_type,
+        source_author = EXCLUDED.source_author,
+        source_title = EXCLUDED.source_title,
+        source_url = EXCLUDED.source_url,
+        category = EXCLUDED.category,
+        note = EXCLUDED.note,
+        location = EXCLUDED.location,
+        highlighted_at = EXCLUDED.highlighted_at,
+        tags = EXCLUDED.tags,
+        embedding = EXCLUDED.embedding
+"""
+
+
+# COPY-based bulk load: rows stream into a per-transaction staging table
+# in one COPY protocol message (no per-row Bind overhead at all), then a
+# single INSERT ... SELECT merges them with upsert semantics. Staging
+# columns are text so COPY needs no pgvector codec; the merge casts.
+_STAGING_CREATE_SQL = """
+    CREATE TEMP TABLE highlight_staging (
+        id text, text text, source_type text, source_author text,
+        source_title text, source_url text, category text, note text,
+        location int, highlighted_at text, tags text, embedding text
+    ) ON COMMIT DROP
+"""
+
+_STAGING_COLUMNS = (
+    "id",
+    "text",
+    "source_type",
+    "source_author",
+    "source_title",
+    "source_url",
+    "category",
+    "note",
+    "location",
+    "highlighted_at",
+    "tags",
+    "embedding",
+)
+
+_STAGING_MERGE_SQL = """
+    INSERT INTO highlight (
+        id, text, source_type, source_author, source_title,
+        source_url, category, note, location, highlighted_at,
+        tags, embedding
+    )
+    SELECT
+        id, text, source_type, source_author, source_title,
+        source_url, category, note, location, highlighted_at,
+        tags::text[], embedding::vector
+    FROM highlight_staging
+    ON CONFLICT (id) DO UPDATE SET
+        text = EXCLUDED.text,
+        source_type = EXCLUDED.source_type,
+        source_author = EXCLUDED.source_author,
+        source_title = EXCLUDED.source_title,
+        source_url = EXCLUDED.source_url,
+        category = EXCLUDED.category,
+        note = EXCLUDED.note,
+        location = EXCLUDED.location,
+        highlighted_at = EXCLUDED.highlighted_at,
+        tags = EXCLUDED.tags,
+        embedding = EXCLUDED.embedding
+"""
+
+
+# One C-level call pulls all ten scalar columns from a highlight dict,
+# replacing ten interpreted __getitem__ round-trips per row
+_SCALAR_FIELDS_GETTER = operator.itemgetter(
+    "id",
+    "text",
+    "source_type",
+    "source_author",
+    "source_title",
+    "source_url",
+    "category",
+    "note",
+    "location",
+    "highlighted_at",
+)
+
+
+def _highlight_row(highlight: Dict[str, Any]) -> tuple:
+    """Flatten a highlight dict into the shared 12-column row shape.
+
+    Expects the full ``Highlight.model_dump()`` key set — scalar fields
+    are fetched with a single itemgetter call.
+    """
+    return _SCALAR_FIELDS_GETTER(highlight) + (
+        _pg_text_array_literal(highlight.get("tags")),
+        _pg_vector_literal(highlight.get("embedding")),
+    )
+
+
+def _pg_text_array_literal(values: Optional[List[str]]) -> Optional[str]:
+    """Render a Python list as a Postgres text[] literal for in-SQL casting."""
+    if values is None:
+        return None
+    quoted = ('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values)
+    return "{" + ",".join(quoted) + "}"
+
+
+def _pg_vector_literal(values: Optional[List[float]]) -> Optional[str]:
+    """Render an embedding as a pgvector text literal for in-SQL casting."""
+    if not values:
+        return None
+    return "[" + ",".join(map(repr, values)) + "]"
+
 
 class SupabaseRetryConfig:
     """Configuration for Supabase-specific retry logic."""
@@ -78,6 +213,7 @@ async def execute_vector_query(
     params: Optional[List[Any]] = None,
     fetch_all: bool = True,
     settings_obj: Optional[Settings] = None,
+    setup_sql: Optional[str] = None,
 ) -> Any:
     """
     Execute a vector-related SQL query using asyncpg with retry logic.
@@ -90,6 +226,8 @@ async def execute_vector_query(
         params: Query parameters
         fetch_all: If True, fetch all results; if False, fetch one
         settings_obj: Settings object (uses global if None)
+        setup_sql: Optional statement (e.g. a SET LOCAL tuning knob) run
+            in the same transaction as the query
 
     Returns:
         Query results
@@ -101,6 +239,14 @@ async def execute_vector_query(
 
     async def _execute():
         async with pool.acquire() as conn:
+            if setup_sql is not None:
+                # SET LOCAL only lives inside a transaction, so the
+                # setup statement and the query must share one
+                async with conn.transaction():
+                    await conn.execute(setup_sql)
+                    if fetch_all:
+                        return await conn.fetch(query, *(params or []))
+                    return await conn.fetchrow(query, *(params or []))
             if fetch_all:
                 return await conn.fetch(query, *(params or []))
             else:
@@ -113,6 +259,7 @@ async def upsert_highlights_vectorized(
     highlights_data: List[Dict[str, Any]],
     batch_size: int = 100,
     settings_obj: Optional[Settings] = None,
+    use_copy: bool = False,
 ) -> int:
     """
     Upsert highlights using vectorized operations with Supabase compatibility.
@@ -124,6 +271,8 @@ async def upsert_highlights_vectorized(
         highlights_data: List of highlight dictionaries to upsert
         batch_size: Number of records to process per batch
         settings_obj: Settings object (uses global if None)
+        use_copy: If True, stream each batch with COPY into a staging
+            table and merge once — fastest for initial backfills
 
     Returns:
         Total number of records processed
@@ -144,56 +293,33 @@ async def upsert_highlights_vectorized(
 
         async def _upsert_batch(batch_data: List[Dict[str, Any]]) -> int:
             async with pool.acquire() as conn:
-                # Use PostgreSQL's ON CONFLICT for efficient upserts
-                query = """
-                    INSERT INTO highlight (
-                        id, text, source_type, source_author, source_title,
-                        source_url, category, note, location, highlighted_at,
-                        tags, embedding
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                    ON CONFLICT (id) DO UPDATE SET
-                        text = EXCLUDED.text,
-                        source_type = EXCLUDED.source_type,
-                        source_author = EXCLUDED.source_author,
-                        source_title = EXCLUDED.source_title,
-                        source_url = EXCLUDED.source_url,
-                        category = EXCLUDED.category,
-                        note = EXCLUDED.note,
-                        location = EXCLUDED.location,
-                        highlighted_at = EXCLUDED.highlighted_at,
-                        tags = EXCLUDED.tags,
-                        embedding = EXCLUDED.embedding
-                """
-
-                # Prepare batch data - ensure embedding is properly formatted
-                batch_records = []
-                for highlight in batch_data:
-                    # Convert embedding list to PostgreSQL vector format if needed
-                    embedding = highlight.get("embedding")
-                    if embedding and isinstance(embedding, list):
-                        # asyncpg handles list -> vector conversion automatically
-                        pass
-
-                    record = (
-                        highlight.get("id"),
-                        highlight.get("text"),
-                        highlight.get("source_type"),
-                        highlight.get("source_author"),
-                        highlight.get("source_title"),
-                        highlight.get("source_url"),
-                        highlight.get("category"),
-                        highlight.get("note"),
-                        highlight.get("location"),
-                        highlight.get("highlighted_at"),
-                        highlight.get("tags"),
-                        embedding,
-                    )
-                    batch_records.append(record)
+                # Transpose the batch column-wise into the parallel arrays
+                # that _UPSERT_UNNEST_SQL binds: one execute per batch
+                # instead of one Bind/Execute round-trip per row
+                rows = [_highlight_row(highlight) for highlight in batch_data]
+                columns = tuple(zip(*rows, strict=True))
+
+                await conn.execute(_UPSERT_UNNEST_SQL, *columns)
+                return len(batch_data)
 
-                await conn.executemany(query, batch_records)
-                return len(batch_records)
+        async def _copy_batch(batch_data: List[Dict[str, Any]]) -> int:
+            async with pool.acquire() as conn:
+                # COPY streams the whole batch in one protocol message;
+                # the staging table lives for this transaction only and
+                # the merge applies upsert semantics in a second statement
+                rows = [_highlight_row(highlight) for highlight in batch_data]
+                async with conn.transaction():
+                    await conn.execute(_STAGING_CREATE_SQL)
+                    await conn.copy_records_to_table(
+                        "highlight_staging",
+                        records=rows,
+                        columns=_STAGING_COLUMNS,
+                    )
+                    await conn.execute(_STAGING_MERGE_SQL)
+                return len(batch_data)
 
-        batch_count = await with_supabase_retry(_upsert_batch, current_batch)
+        batch_op = _copy_batch if use_copy else _upsert_batch
+        batch_count = await with_supabase_retry(batch_op, current_batch)
         total_processed += batch_count
 
         logger.info(
@@ -208,6 +334,94 @@ async def upsert_highlights_vectorized(
     return total_processed
 
 
+# Batched similarity search: every query in the batch rides in as one
+# element of a text[] parameter and fans out through a LATERAL subquery,
+# so Postgres parses, plans and round-trips once per batch instead of
+# once per caller. WITH ORDINALITY keeps results aligned with the input.
+_BATCHED_SEARCH_SQL = """
+    SELECT
+        q.i AS query_index,
+        h.id, h.text, h.source_type, h.source_author, h.source_title,
+        h.source_url, h.category, h.note, h.location, h.highlighted_at,
+        h.tags, h.embedding, h.score
+    FROM unnest($1::text[], $2::int[]) WITH ORDINALITY AS q(embedding, k, i)
+    CROSS JOIN LATERAL (
+        SELECT
+            id, text, source_type, source_author, source_title,
+            source_url, category, note, location, highlighted_at,
+            tags, embedding,
+            embedding <=> q.embedding::vector AS score
+        FROM highlight
+        WHERE embedding IS NOT NULL
+        ORDER BY score
+        LIMIT q.k
+    ) h
+    ORDER BY q.i, h.score
+"""
+
+
+async def batched_vector_search(
+    query_embeddings: List[List[float]],
+    ks: List[int],
+    settings_obj: Optional[Settings] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run several unfiltered similarity searches as one Postgres query.
+
+    The HNSW scan is widened with the same ``hnsw.ef_search`` heuristic
+    as :func:`vector_similarity_search`; since SET LOCAL spans the whole
+    batch transaction, the largest ``k`` in the batch governs, so no
+    query gets a narrower scan than it would on its own.
+
+    Args:
+        query_embeddings: One query vector per search
+        ks: Result limit per search, aligned with ``query_embeddings``
+        settings_obj: Settings object (uses global if None)
+
+    Returns:
+        One result list per input query, in input order
+    """
+    if settings_obj is None:
+        settings_obj = settings
+
+    params: List[Any] = [
+        [_pg_vector_literal(embedding) for embedding in query_embeddings],
+        list(ks),
+    ]
+    # Match the single-query path's recall tuning; max(ks) keeps every
+    # batched query at least as wide as it would be alone
+    ef_search = max(max(ks) * 2, 40)
+    rows = await execute_vector_query(
+        _BATCHED_SEARCH_SQL,
+        params,
+        fetch_all=True,
+        settings_obj=settings_obj,
+        setup_sql=f"SET LOCAL hnsw.ef_search = {ef_search}",
+    )
+
+    grouped: List[List[Dict[str, Any]]] = [[] for _ in query_embeddings]
+    for row in rows:
+        # query_index is the 1-based ordinality of the originating query
+        grouped[row["query_index"] - 1].append(
+            {
+                "id": row["id"],
+                "text": row["text"],
+                "source_type": row["source_type"],
+                "source_author": row["source_author"],
+                "source_title": row["source_title"],
+                "source_url": row["source_url"],
+                "category": row["category"],
+                "note": row["note"],
+                "location": row["location"],
+                "highlighted_at": row["highlighted_at"],
+                "tags": row["tags"],
+                "embedding": list(row["embedding"]) if row["embedding"] else None,
+                "score": float(row["score"]),
+            }
+        )
+    return grouped
+
+
 async def vector_similarity_search(
     query_embedding: List[float],
     k: int = 5,
@@ -236,6 +450,10 @@ async def vector_similarity_search(
     if settings_obj is None:
         settings_obj = settings
 
+    if k <= 0:
+        # Nothing can match a non-positive limit; skip the round-trip
+        return
+
     # Build the WHERE clause dynamically
     where_conditions = ["embedding IS NOT NULL"]
     params: List[Any] = [query_embedding]
@@ -258,21 +476,39 @@ async def vector_similarity_search(
 
     where_clause = " AND ".join(where_conditions)
 
-    # Use cosine distance with pgvector - compatible with Postgres 14+
+    # Use cosine distance with pgvector - compatible with Postgres 14+.
+    # Filters are pushed into a CTE so the distance operator only runs
+    # over the filtered candidate set, not the whole table
     query = f"""
+        WITH candidates AS (
+            SELECT
+                id, text, source_type, source_author, source_title,
+                source_url, category, note, location, highlighted_at,
+                tags, embedding
+            FROM highlight
+            WHERE {where_clause}
+        )
         SELECT
             id, text, source_type, source_author, source_title,
             source_url, category, note, location, highlighted_at,
             tags, embedding,
             embedding <=> $1 as score
-        FROM highlight
-        WHERE {where_clause}
+        FROM candidates
         ORDER BY score
         LIMIT {k}
     """
 
+    # Widen the HNSW candidate queue for this query: pgvector's default
+    # ef_search of 40 caps recall for larger k. SET cannot take bind
+    # parameters, so the (integer) value is interpolated directly.
+    ef_search = max(k * 2, 40)
+
     results = await execute_vector_query(
-        query, params, fetch_all=True, settings_obj=settings_obj
+        query,
+        params,
+        fetch_all=True,
+        settings_obj=settings_obj,
+        setup_sql=f"SET LOCAL hnsw.ef_search = {ef_search}",
     )
 
     for row in results:
@@ -6,17 +6,26 @@ over TCP connections using newline-delimited JSON (NDJSON).
 """
 
 import asyncio
-import json
 import logging
-from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Optional, Union
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Union
+
+import msgspec
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class MCPMessage:
-    """Represents an MCP JSON-RPC 2.0 message"""
+class MCPMessage(msgspec.Struct):
+    """Represents an MCP JSON-RPC 2.0 message.
+
+    A msgspec.Struct rather than a dataclass: instantiation is C-level and
+    instances carry no per-object __dict__, which matters at one object per
+    frame on the framing hot path. Serialization still goes through
+    ``to_dict`` because the JSON-RPC id rules (omit for notifications,
+    include-even-when-null for responses) cannot be expressed with a flat
+    omit-defaults encoding.
+    """
 
     jsonrpc: str = "2.0"
     method: Optional[str] = None
@@ -27,28 +36,34 @@ class MCPMessage:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        # Bind fields to locals once: each self.<attr> is a descriptor call
+        # and this method runs once per packed frame
+        method = self.method
+        params = self.params
+        msg_id = self.id
+        result = self.result
+        error = self.error
+
         data: Dict[str, Any] = {"jsonrpc": self.jsonrpc}
 
         # Request messages include the method and optional params
-        if self.method is not None:
-            data["method"] = self.method
-        if self.params is not None:
-            data["params"] = self.params
-
-        has_result_or_error = self.result is not None or self.error is not None
+        if method is not None:
+            data["method"] = method
+        if params is not None:
+            data["params"] = params
 
         # According to the JSON-RPC 2.0 spec the *response* object MUST include an
         # "id" member which is identical to that of the request **even when it is
         # null**. A request (notification) must omit the id entirely.  ↳ because
         # of this we include the id for responses or when the id is explicitly
         # provided, otherwise we omit it to keep notifications spec-compliant.
-        if has_result_or_error or self.id is not None:
-            data["id"] = self.id  # This will serialise to `null` when None.
+        if result is not None or error is not None or msg_id is not None:
+            data["id"] = msg_id  # This will serialise to `null` when None.
 
-        if self.result is not None:
-            data["result"] = self.result
-        if self.error is not None:
-            data["error"] = self.error
+        if result is not None:
+            data["result"] = result
+        if error is not None:
+            data["error"] = error
 
         return data
 
@@ -65,6 +80,102 @@ class MCPMessage:
         )
 
 
+class MessagePool:
+    """Freelist of recycled MCPMessage instances for high-throughput readers.
+
+    At sustained message rates allocation and GC of one struct per frame
+    becomes measurable; consumers that are done with a message can hand it
+    back via :meth:`recycle` and the read loop will refill it in place.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._free: deque[MCPMessage] = deque(maxlen=maxsize)
+
+    def acquire(self) -> MCPMessage:
+        """Return a recycled message, or a fresh one if the pool is empty."""
+        try:
+            return self._free.popleft()
+        except IndexError:
+            return MCPMessage()
+
+    def recycle(self, message: MCPMessage) -> None:
+        """Hand a processed message back for reuse."""
+        self._free.append(message)
+
+
+class _WireMessage(msgspec.Struct):
+    """Compiled JSON-RPC 2.0 envelope validator for the read path.
+
+    ``jsonrpc: Literal["2.0"]`` makes msgspec reject a wrong or missing
+    version (and non-object payloads) during one C-level validation pass,
+    replacing the previous hand-written isinstance/dict.get checks.
+    """
+
+    jsonrpc: Literal["2.0"]
+    method: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    id: Optional[Union[str, int]] = None
+    result: Optional[Any] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class BufferedLineReader:
+    """Newline framing over a raw ``read()``-style stream.
+
+    ``asyncio.StreamReader`` already buffers internally, but transports that
+    only expose ``read()`` would otherwise force byte-at-a-time scanning.
+    Incoming chunks accumulate in a ``bytearray`` and lines are located with
+    ``bytes.find``, which runs on the C-level memchr fast path.
+    """
+
+    def __init__(
+        self,
+        reader: Any,
+        chunk_size: int = 65536,
+        max_line_length: Optional[int] = None,
+    ):
+        self._reader = reader
+        self._chunk_size = chunk_size
+        self._max_line_length = max_line_length
+        self._buf = bytearray()
+
+    async def readline(self) -> bytes:
+        """Return one newline-terminated line (or the trailing partial line).
+
+        Raises:
+            MCPFramingError: If a line exceeds ``max_line_length`` — checked
+                while buffering, so an oversized line aborts early instead of
+                being accumulated in full.
+        """
+        while True:
+            idx = self._buf.find(b"\n")
+            if idx != -1:
+                line = bytes(self._buf[: idx + 1])
+                del self._buf[: idx + 1]
+                return line
+
+            if (
+                self._max_line_length is not None
+                and len(self._buf) > self._max_line_length
+            ):
+                raise MCPFramingError(f"Message too long: {len(self._buf)} bytes")
+
+            chunk = await self._reader.read(self._chunk_size)
+            if not chunk:
+                # EOF: hand back whatever is left, mirroring StreamReader
+                line = bytes(self._buf)
+                self._buf.clear()
+                return line
+            self._buf.extend(chunk)
+
+    def at_eof(self) -> bool:
+        """Best-effort EOF check delegating to the wrapped stream."""
+        if self._buf:
+            return False
+        at_eof = getattr(self._reader, "at_eof", None)
+        return bool(at_eof()) if at_eof is not None else False
+
+
 class MCPFramingError(Exception):
     """Raised when MCP message framing fails"""
 
@@ -77,6 +188,10 @@ class MCPProtocolError(Exception):
     pass
 
 
+# Every standard frame starts with this identical envelope prefix
+_JSONRPC_PREFIX = b'{"jsonrpc":"2.0"'
+
+
 def pack_mcp_message(message: MCPMessage) -> bytes:
     """
     Pack an MCP message into NDJSON format for TCP transmission.
@@ -91,13 +206,92 @@ def pack_mcp_message(message: MCPMessage) -> bytes:
         MCPFramingError: If JSON serialization fails
     """
     try:
-        json_str = json.dumps(message.to_dict(), separators=(",", ":"))
-        # ↳ because we want compact JSON and NDJSON needs newline delimiter
-        return (json_str + "\n").encode("utf-8")
+        # ↳ orjson emits compact UTF-8 bytes directly; OPT_APPEND_NEWLINE
+        #    writes the NDJSON delimiter inside the serializer, saving a
+        #    bytes concat (and its allocation) per frame
+        data = message.to_dict()
+        if data.pop("jsonrpc", None) != "2.0":
+            # Non-standard version: fall back to serializing the whole dict
+            return orjson.dumps(message.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+
+        if not data:
+            return _JSONRPC_PREFIX + b"}\n"
+
+        # The envelope prefix is constant, so only serialize the variable
+        # tail and splice it in after the pre-rendered prefix
+        tail = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        return _JSONRPC_PREFIX + b"," + tail[1:]
     except (TypeError, ValueError) as e:
         raise MCPFramingError(f"Failed to serialize MCP message: {e}") from e
 
 
+# Width of the little-endian length header used by the binary framing
+_LENGTH_PREFIX_BYTES = 4
+
+
+def pack_mcp_frame(message: MCPMessage) -> bytes:
+    """
+    Pack an MCP message with a 4-byte little-endian length prefix.
+
+    Opt-in alternative to NDJSON for trusted peer-to-peer links: the
+    reader recovers the payload with two readexactly() calls instead of
+    scanning every byte for the newline delimiter, which matters on large
+    payloads. NDJSON (:func:`pack_mcp_message`) stays the wire default
+    because line-oriented clients (e.g. ``nc`` sessions) depend on it.
+
+    Args:
+        message: MCPMessage to pack
+
+    Returns:
+        Length-prefixed UTF-8 JSON bytes
+
+    Raises:
+        MCPFramingError: If JSON serialization fails
+    """
+    try:
+        body = orjson.dumps(message.to_dict())
+    except (TypeError, ValueError) as e:
+        raise MCPFramingError(f"Failed to serialize MCP message: {e}") from e
+    return len(body).to_bytes(_LENGTH_PREFIX_BYTES, "little") + body
+
+
+async def read_mcp_frame(
+    reader: asyncio.StreamReader,
+    max_length: int = 1024 * 1024,
+    into: Optional[MCPMessage] = None,
+) -> MCPMessage:
+    """
+    Read a single length-prefixed MCP message (see :func:`pack_mcp_frame`).
+
+    Args:
+        reader: asyncio StreamReader
+        max_length: Maximum allowed payload length to prevent DoS
+        into: Optional recycled MCPMessage to refill in place
+
+    Returns:
+        Parsed MCPMessage
+
+    Raises:
+        MCPFramingError: If the frame is oversized, empty or invalid JSON
+        MCPProtocolError: If the message violates JSON-RPC 2.0 spec
+        ConnectionError: If connection is closed mid-frame
+    """
+    try:
+        header = await reader.readexactly(_LENGTH_PREFIX_BYTES)
+        length = int.from_bytes(header, "little")
+        # Length is known up front, so the cap is enforced before a single
+        # payload byte is buffered
+        if length > max_length:
+            raise MCPFramingError(f"Message too long: {length} bytes")
+        if length == 0:
+            raise MCPFramingError("Empty message received")
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed by client") from e
+
+    return _decode_payload(payload, into)
+
+
 def create_request(
     method: str,
     params: Optional[Dict[str, Any]] = None,
@@ -156,8 +350,46 @@ def create_error_response(
     return MCPMessage(error=error_obj, id=request_id)
 
 
+def _decode_payload(payload: bytes, into: Optional[MCPMessage]) -> MCPMessage:
+    """Parse and validate one JSON-RPC payload into an MCPMessage.
+
+    Shared by the NDJSON and length-prefixed read paths: orjson validates
+    UTF-8 and parses in a single pass, then msgspec checks the envelope
+    in one compiled validation pass.
+
+    Raises:
+        MCPFramingError: If the bytes are not valid UTF-8 JSON
+        MCPProtocolError: If the payload violates JSON-RPC 2.0
+    """
+    try:
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError as e:
+        # orjson reports malformed UTF-8 through the same exception type
+        if "UTF-8" in str(e):
+            raise MCPFramingError(f"Invalid UTF-8 encoding: {e}") from e
+        raise MCPFramingError(f"Invalid JSON: {e}") from e
+
+    try:
+        wire = msgspec.convert(data, _WireMessage)
+    except msgspec.ValidationError as e:
+        if "jsonrpc" in str(e):
+            raise MCPProtocolError("Invalid or missing jsonrpc version") from e
+        raise MCPProtocolError("Message must be a JSON object") from e
+
+    message = into if into is not None else MCPMessage()
+    message.jsonrpc = wire.jsonrpc
+    message.method = wire.method
+    message.params = wire.params
+    message.id = wire.id
+    message.result = wire.result
+    message.error = wire.error
+    return message
+
+
 async def read_mcp_message(
-    reader: asyncio.StreamReader, max_line_length: int = 1024 * 1024
+    reader: asyncio.StreamReader,
+    max_line_length: int = 1024 * 1024,
+    into: Optional[MCPMessage] = None,
 ) -> MCPMessage:
     """
     Read and parse a single MCP message from TCP stream.
@@ -165,6 +397,7 @@ async def read_mcp_message(
     Args:
         reader: asyncio StreamReader
         max_line_length: Maximum allowed line length to prevent DoS
+        into: Optional recycled MCPMessage to refill in place
 
     Returns:
         Parsed MCPMessage
@@ -174,36 +407,32 @@ async def read_mcp_message(
         MCPProtocolError: If message violates JSON-RPC 2.0 spec
         ConnectionError: If connection is closed
     """
+    if not hasattr(reader, "readline"):
+        # Raw read()-style stream: add newline framing with chunked buffering
+        # (the length cap is enforced while buffering, bounding memory early)
+        reader = BufferedLineReader(reader, max_line_length=max_line_length)
+
+    # Read one line (NDJSON format)
     try:
-        # Read one line (NDJSON format)
         line_bytes = await reader.readline()
+    except ValueError as e:
+        # StreamReader.readline signals an over-limit line with ValueError
+        # (wrapping LimitOverrunError); surface it as the same framing
+        # error the explicit length check below produces so callers answer
+        # with a parse error instead of crashing with an internal one
+        raise MCPFramingError(f"Message too long: {e}") from e
 
-        if not line_bytes:
-            raise ConnectionError("Connection closed by client")
+    if not line_bytes:
+        raise ConnectionError("Connection closed by client")
 
-        if len(line_bytes) > max_line_length:
-            raise MCPFramingError(f"Message too long: {len(line_bytes)} bytes")
+    if len(line_bytes) > max_line_length:
+        raise MCPFramingError(f"Message too long: {len(line_bytes)} bytes")
 
-        # Decode and parse JSON
-        line_str = line_bytes.decode("utf-8").rstrip("\n\r")
-        if not line_str:
-            raise MCPFramingError("Empty message received")
-
-        data = json.loads(line_str)
+    line_bytes = line_bytes.rstrip(b"\n\r")
+    if not line_bytes:
+        raise MCPFramingError("Empty message received")
 
-        # Validate basic JSON-RPC 2.0 structure
-        if not isinstance(data, dict):
-            raise MCPProtocolError("Message must be a JSON object")
-
-        if data.get("jsonrpc") != "2.0":
-            raise MCPProtocolError("Invalid or missing jsonrpc version")
-
-        return MCPMessage.from_dict(data)
-
-    except json.JSONDecodeError as e:
-        raise MCPFramingError(f"Invalid JSON: {e}") from e
-    except UnicodeDecodeError as e:
-        raise MCPFramingError(f"Invalid UTF-8 encoding: {e}") from e
+    return _decode_payload(line_bytes, into)
 
 
 async def write_mcp_message(writer: asyncio.StreamWriter, message: MCPMessage) -> None:
@@ -229,8 +458,41 @@ async def write_mcp_message(writer: asyncio.StreamWriter, message: MCPMessage) -
         raise ConnectionError("Connection broken") from e
 
 
+async def write_mcp_messages(
+    writer: asyncio.StreamWriter, messages: list[MCPMessage]
+) -> None:
+    """
+    Write a batch of MCP messages with a single write and drain.
+
+    Coalescing the frames saves (n-1) drain awaits and syscalls compared
+    with writing each message individually.
+
+    Args:
+        writer: asyncio StreamWriter
+        messages: MCPMessages to send, in order
+
+    Raises:
+        MCPFramingError: If any message fails to serialize
+        ConnectionError: If connection is closed
+    """
+    if not messages:
+        return
+
+    try:
+        payload = b"".join(pack_mcp_message(message) for message in messages)
+        writer.write(payload)
+        await writer.drain()
+
+    except ConnectionResetError as e:
+        raise ConnectionError("Connection closed by client") from e
+    except BrokenPipeError as e:
+        raise ConnectionError("Connection broken") from e
+
+
 async def read_mcp_messages(
-    reader: asyncio.StreamReader, max_messages: Optional[int] = None
+    reader: asyncio.StreamReader,
+    max_messages: Optional[int] = None,
+    pool: Optional[MessagePool] = None,
 ) -> AsyncIterator[MCPMessage]:
     """
     Read multiple MCP messages from stream until EOF or limit reached.
@@ -238,6 +500,8 @@ async def read_mcp_messages(
     Args:
         reader: asyncio StreamReader
         max_messages: Optional limit on number of messages to read
+        pool: Optional MessagePool; recycled instances are refilled in place
+            instead of allocating one message per frame
 
     Yields:
         MCPMessage instances
@@ -248,13 +512,19 @@ async def read_mcp_messages(
     """
     count = 0
 
+    if not hasattr(reader, "readline"):
+        # Wrap once so buffered bytes carry over between messages
+        reader = BufferedLineReader(reader)
+
     while max_messages is None or count < max_messages:
         try:
             if reader.at_eof():
                 logger.debug("Stream EOF reached")
                 break
 
-            message = await read_mcp_message(reader)
+            message = await read_mcp_message(
+                reader, into=pool.acquire() if pool is not None else None
+            )
             yield message
             count += 1
 
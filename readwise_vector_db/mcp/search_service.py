@@ -6,16 +6,48 @@ and invoking semantic search, used by both TCP and HTTP SSE MCP endpoints.
 
 import asyncio
 import logging
+import sys
 from datetime import date
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
 
 from readwise_vector_db.core.search import semantic_search
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2048)
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse an ISO date string, memoizing both hits and misses.
+
+    Range boundaries repeat heavily across requests (today, yesterday,
+    quarter starts), so the parsed date — or the None for a known-bad
+    string — is served from cache after the first call.
+    """
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
 class SearchParams:
-    """Validated search parameters for MCP requests."""
+    """Validated search parameters for MCP requests.
+
+    ``__slots__`` drops the per-instance ``__dict__``: one of these is
+    allocated per request, so fixed slot storage saves an allocation and
+    makes attribute reads a direct offset load on the search hot path.
+    """
+
+    __slots__ = (
+        "query",
+        "k",
+        "source_type",
+        "author",
+        "tags",
+        "highlighted_at_range",
+    )
 
     def __init__(
         self,
@@ -34,28 +66,55 @@ class SearchParams:
         self.highlighted_at_range = highlighted_at_range
 
     def __str__(self) -> str:
-        """String representation for logging."""
-        return f"SearchParams(query='{self.query}', k={self.k}, filters={self._filter_summary()})"
-
-    def _filter_summary(self) -> str:
-        """Create a summary of active filters for logging."""
-        filters = []
-        if self.source_type:
-            filters.append(f"source_type={self.source_type}")
-        if self.author:
-            filters.append(f"author={self.author}")
-        if self.tags:
-            filters.append(f"tags={len(self.tags)} items")
-        if self.highlighted_at_range:
-            filters.append(
-                f"date_range={self.highlighted_at_range[0]} to {self.highlighted_at_range[1]}"
+        """String representation for logging.
+
+        One concatenation chain of inline conditionals — no intermediate
+        filter list or join — since this runs once per logged request.
+        """
+        return (
+            f"SearchParams(query='{self.query}', k={self.k}"
+            + (f", source_type={self.source_type}" if self.source_type else "")
+            + (f", author={self.author}" if self.author else "")
+            + (f", tags={len(self.tags)} items" if self.tags else "")
+            + (
+                f", date_range={self.highlighted_at_range[0]}"
+                f" to {self.highlighted_at_range[1]}"
+                if self.highlighted_at_range
+                else ""
             )
-        return "{" + ", ".join(filters) + "}" if filters else "none"
+            + ")"
+        )
 
 
 class SearchService:
     """Shared service for processing MCP search requests."""
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_params(
+        query: str,
+        k: int,
+        source_type: Optional[str],
+        author: Optional[str],
+        tags: Optional[Tuple[str, ...]],
+        highlighted_at_range: Optional[Tuple[date, date]],
+    ) -> SearchParams:
+        """Construct (or reuse) a SearchParams for normalized inputs.
+
+        Parsing is deterministic over these fields, so repeated identical
+        queries — the common case for dashboards and retried MCP calls —
+        reuse one frozen-by-convention instance instead of re-validating
+        and re-allocating per request. Callers must not mutate the result.
+        """
+        return SearchParams(
+            query=query,
+            k=k,
+            source_type=source_type,
+            author=author,
+            tags=list(tags) if tags is not None else None,
+            highlighted_at_range=highlighted_at_range,
+        )
+
     @staticmethod
     def parse_mcp_params(params: Dict[str, Any]) -> SearchParams:
         """Parse and validate MCP protocol search parameters.
@@ -83,32 +142,45 @@ class SearchService:
         source_type = params.get("source_type")
         author = params.get("author")
         tags = params.get("tags")
+        if isinstance(tags, list):
+            # Interned tags are shared across requests, halving memory for
+            # repeated filters and making the cache key cheaper to hash
+            tags = [sys.intern(t) if isinstance(t, str) else t for t in tags]
 
         # Parse date range if provided
         highlighted_at_range = None
-        if params.get("highlighted_at_range") and isinstance(
-            params["highlighted_at_range"], list
-        ):
+        range_data = params.get("highlighted_at_range")
+        if isinstance(range_data, list) and len(range_data) >= 2:
             try:
-                range_data = params["highlighted_at_range"]
-                if len(range_data) >= 2:
-                    start = date.fromisoformat(range_data[0]) if range_data[0] else None
-                    end = date.fromisoformat(range_data[1]) if range_data[1] else None
-                    if start and end:
-                        highlighted_at_range = (start, end)
-            except (ValueError, TypeError):
-                logger.warning(
-                    f"Invalid date range: {params.get('highlighted_at_range')}"
-                )
-
-        return SearchParams(
-            query=query,
-            k=k,
-            source_type=source_type,
-            author=author,
-            tags=tags,
-            highlighted_at_range=highlighted_at_range,
-        )
+                start = _parse_date(range_data[0])
+                end = _parse_date(range_data[1])
+            except TypeError:
+                # Unhashable boundary values cannot hit the cache (or parse)
+                start = end = None
+            if start and end:
+                highlighted_at_range = (start, end)
+            elif range_data[0] or range_data[1]:
+                logger.warning(f"Invalid date range: {range_data}")
+
+        try:
+            return SearchService._build_params(
+                query,
+                k,
+                source_type,
+                author,
+                tuple(tags) if isinstance(tags, list) else tags,
+                highlighted_at_range,
+            )
+        except TypeError:
+            # Unhashable filter values (malformed input) bypass the cache
+            return SearchParams(
+                query=query,
+                k=k,
+                source_type=source_type,
+                author=author,
+                tags=tags,
+                highlighted_at_range=highlighted_at_range,
+            )
 
     @staticmethod
     def parse_http_params(
@@ -147,22 +219,47 @@ class SearchService:
         # Parse date range if both dates provided
         highlighted_at_range = None
         if from_date and to_date:
-            try:
-                start = date.fromisoformat(from_date) if from_date else None
-                end = date.fromisoformat(to_date) if to_date else None
-                if start and end:
-                    highlighted_at_range = (start, end)
-            except (ValueError, TypeError):
+            start = _parse_date(from_date)
+            end = _parse_date(to_date)
+            if start and end:
+                highlighted_at_range = (start, end)
+            else:
                 logger.warning(f"Invalid date range: {from_date} to {to_date}")
 
-        return SearchParams(
-            query=query,
-            k=k,
-            source_type=source_type,
-            author=author,
-            tags=tags,
-            highlighted_at_range=highlighted_at_range,
+        return SearchService._build_params(
+            query,
+            k,
+            source_type,
+            author,
+            tuple(tags) if tags is not None else None,
+            highlighted_at_range,
+        )
+
+    @staticmethod
+    async def stream_search(
+        search_params: SearchParams,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Resolve the raw semantic_search stream for direct iteration.
+
+        Unlike ``execute_search`` this does not re-yield each item, so
+        callers that need no per-result interception (the SSE route)
+        iterate the underlying generator directly and skip one coroutine
+        hop per result.
+        """
+        result = semantic_search(
+            search_params.query,
+            search_params.k,
+            search_params.source_type,
+            search_params.author,
+            search_params.tags,
+            search_params.highlighted_at_range,
+            stream=True,
         )
+        # semantic_search is a coroutine function; mocks may hand back the
+        # async generator without the coroutine wrapper
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result  # type: ignore[return-value]
 
     @staticmethod
     async def execute_search(
@@ -12,11 +12,14 @@ from readwise_vector_db.core.search import get_openai_client, semantic_search
 @pytest.mark.asyncio
 async def test_get_openai_client():
     """Test the OpenAI client singleton pattern"""
+    # Also stub the httpx transport: with os.environ.get patched globally,
+    # building a real client would honor SSLKEYLOGFILE="dummy-key"
     with patch("os.environ.get", return_value="dummy-key"):
-        with patch("openai.AsyncClient") as mock_client:
-            # First call should create the client
+        with patch("httpx.AsyncClient"), patch("openai.AsyncClient") as mock_client:
+            # First call should create the client over the shared HTTP transport
             client1 = get_openai_client()
-            mock_client.assert_called_once_with(api_key="dummy-key")
+            mock_client.assert_called_once()
+            assert mock_client.call_args.kwargs["api_key"] == "dummy-key"
 
             # Second call should reuse the existing client
             client2 = get_openai_client()
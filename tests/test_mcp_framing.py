@@ -2,23 +2,29 @@
 Unit tests for MCP Protocol Framing and Message Handling
 """
 
+import asyncio
 import json
 from io import BytesIO
 
 import pytest
 
 from readwise_vector_db.mcp.framing import (
+    BufferedLineReader,
     JSONRPCErrorCodes,
     MCPFramingError,
     MCPMessage,
     MCPProtocolError,
+    MessagePool,
     create_error_response,
     create_request,
     create_response,
+    pack_mcp_frame,
     pack_mcp_message,
+    read_mcp_frame,
     read_mcp_message,
     read_mcp_messages,
     write_mcp_message,
+    write_mcp_messages,
 )
 
 
@@ -69,6 +75,14 @@ class TestMCPMessage:
         assert msg.params == {"q": "test"}
         assert msg.id == "123"
 
+    def test_no_per_instance_dict(self):
+        """Test messages stay slotted (msgspec.Struct) with no __dict__"""
+        msg = MCPMessage()
+
+        # ↳ because a per-instance __dict__ would regress the memory/attribute
+        #   access win of the struct representation
+        assert not hasattr(msg, "__dict__")
+
     def test_from_dict_defaults(self):
         """Test creating message from minimal dictionary"""
         data = {"method": "ping"}
@@ -238,38 +252,44 @@ class TestMessageReading:
         assert msg.id == "123"
 
     @pytest.mark.asyncio
-    async def test_read_empty_connection(self):
-        """Test reading from closed connection"""
-        reader = AsyncReaderWriter(b"")
-
-        with pytest.raises(ConnectionError, match="Connection closed"):
-            await read_mcp_message(reader)
-
-    @pytest.mark.asyncio
-    async def test_read_invalid_json(self):
-        """Test reading invalid JSON"""
-        invalid_json = '{"jsonrpc":"2.0","method":"search"\n'  # Missing closing brace
-        reader = AsyncReaderWriter(invalid_json.encode("utf-8"))
-
-        with pytest.raises(MCPFramingError, match="Invalid JSON"):
-            await read_mcp_message(reader)
-
-    @pytest.mark.asyncio
-    async def test_read_invalid_protocol(self):
-        """Test reading non-JSON-RPC message"""
-        invalid_protocol = '{"version":"1.0","method":"search"}\n'
-        reader = AsyncReaderWriter(invalid_protocol.encode("utf-8"))
-
-        with pytest.raises(MCPProtocolError, match="Invalid or missing jsonrpc"):
-            await read_mcp_message(reader)
-
-    @pytest.mark.asyncio
-    async def test_read_non_object(self):
-        """Test reading non-object JSON"""
-        non_object = '"just a string"\n'
-        reader = AsyncReaderWriter(non_object.encode("utf-8"))
-
-        with pytest.raises(MCPProtocolError, match="Message must be a JSON object"):
+    @pytest.mark.parametrize(
+        ("raw", "exc_type", "match"),
+        [
+            pytest.param(
+                b"", ConnectionError, "Connection closed", id="empty-connection"
+            ),
+            pytest.param(
+                b'{"jsonrpc":"2.0","method":"search"\n',  # Missing closing brace
+                MCPFramingError,
+                "Invalid JSON",
+                id="invalid-json",
+            ),
+            pytest.param(
+                b'{"version":"1.0","method":"search"}\n',
+                MCPProtocolError,
+                "Invalid or missing jsonrpc",
+                id="invalid-protocol",
+            ),
+            pytest.param(
+                b'"just a string"\n',
+                MCPProtocolError,
+                "Message must be a JSON object",
+                id="non-object",
+            ),
+            pytest.param(b"\n", MCPFramingError, "Empty message", id="empty-line"),
+            pytest.param(
+                b'{"jsonrpc":"2.0","data":"\xff\xfe"}\n',
+                MCPFramingError,
+                "Invalid UTF-8",
+                id="invalid-utf8",
+            ),
+        ],
+    )
+    async def test_read_errors(self, raw, exc_type, match):
+        """Test malformed input raises the right framing/protocol error"""
+        reader = AsyncReaderWriter(raw)
+
+        with pytest.raises(exc_type, match=match):
             await read_mcp_message(reader)
 
     @pytest.mark.asyncio
@@ -282,20 +302,15 @@ class TestMessageReading:
             await read_mcp_message(reader, max_line_length=1000)
 
     @pytest.mark.asyncio
-    async def test_read_empty_line(self):
-        """Test reading empty line"""
-        reader = AsyncReaderWriter(b"\n")
-
-        with pytest.raises(MCPFramingError, match="Empty message"):
-            await read_mcp_message(reader)
-
-    @pytest.mark.asyncio
-    async def test_read_invalid_utf8(self):
-        """Test reading invalid UTF-8"""
-        invalid_utf8 = b'{"jsonrpc":"2.0","data":"\xff\xfe"}\n'
-        reader = AsyncReaderWriter(invalid_utf8)
+    async def test_stream_reader_limit_maps_to_framing_error(self):
+        """Test an over-limit StreamReader line surfaces as MCPFramingError"""
+        # A real StreamReader with a small limit: an unterminated line past
+        # the cap makes readline() raise ValueError, which read_mcp_message
+        # must convert into the parse-error path rather than crash on
+        reader = asyncio.StreamReader(limit=64)
+        reader.feed_data(b"x" * 2048)
 
-        with pytest.raises(MCPFramingError, match="Invalid UTF-8"):
+        with pytest.raises(MCPFramingError, match="Message too long"):
             await read_mcp_message(reader)
 
 
@@ -316,6 +331,30 @@ class TestMessageWriting:
         )
         assert written_data == expected.encode("utf-8")
 
+    @pytest.mark.asyncio
+    async def test_write_message_batch(self):
+        """Test writing a batch of messages in one coalesced payload"""
+        writer = AsyncReaderWriter()
+        messages = [
+            MCPMessage(method="search", params={"q": "test"}, id="1"),
+            MCPMessage(result={"data": "test"}, id="1"),
+        ]
+
+        await write_mcp_messages(writer, messages)
+
+        written_data = writer.written.getvalue()
+        expected = b"".join(pack_mcp_message(m) for m in messages)
+        assert written_data == expected
+
+    @pytest.mark.asyncio
+    async def test_write_empty_batch_is_noop(self):
+        """Test that an empty batch writes nothing"""
+        writer = AsyncReaderWriter()
+
+        await write_mcp_messages(writer, [])
+
+        assert writer.written.getvalue() == b""
+
 
 class TestMessageStreaming:
     """Test streaming multiple messages"""
@@ -378,6 +417,169 @@ class TestMessageStreaming:
         assert received_messages[1].result == {"data": "test"}
 
 
+class RawChunkReader:
+    """Mock stream exposing only read(), to exercise BufferedLineReader"""
+
+    def __init__(self, data: bytes, chunk_size: int = 4):
+        self.data = data
+        self.position = 0
+        self.chunk_size = chunk_size
+
+    async def read(self, n: int = -1) -> bytes:
+        """Return the next small chunk, simulating short TCP reads"""
+        chunk = self.data[self.position : self.position + self.chunk_size]
+        self.position += len(chunk)
+        return chunk
+
+
+class TestBufferedLineReader:
+    """Test newline framing over raw read()-style streams"""
+
+    @pytest.mark.asyncio
+    async def test_reassembles_lines_across_chunks(self):
+        """Test that lines split across small reads come back whole"""
+        reader = BufferedLineReader(RawChunkReader(b"first line\nsecond\n"))
+
+        assert await reader.readline() == b"first line\n"
+        assert await reader.readline() == b"second\n"
+        assert await reader.readline() == b""
+
+    @pytest.mark.asyncio
+    async def test_single_byte_chunks(self):
+        """Test incremental scanning when bytes arrive one at a time"""
+        # Worst-case fragmentation: every read() returns a single byte, so
+        # the newline scan must make progress across many tiny refills
+        reader = BufferedLineReader(RawChunkReader(b"a\nbb\nccc\n", chunk_size=1))
+
+        assert await reader.readline() == b"a\n"
+        assert await reader.readline() == b"bb\n"
+        assert await reader.readline() == b"ccc\n"
+        assert await reader.readline() == b""
+
+    @pytest.mark.asyncio
+    async def test_returns_trailing_partial_line_at_eof(self):
+        """Test that a line without trailing newline is returned at EOF"""
+        reader = BufferedLineReader(RawChunkReader(b"no newline"))
+
+        assert await reader.readline() == b"no newline"
+
+    @pytest.mark.asyncio
+    async def test_oversized_line_aborts_during_buffering(self):
+        """Test the length cap fires while buffering, before full accumulation"""
+        raw = RawChunkReader(b"x" * 5000 + b"\n", chunk_size=512)
+        reader = BufferedLineReader(raw, max_line_length=1000)
+
+        with pytest.raises(MCPFramingError, match="Message too long"):
+            await reader.readline()
+
+        # Aborted well before consuming the whole oversized line
+        assert raw.position < 5000
+
+    @pytest.mark.asyncio
+    async def test_read_mcp_message_accepts_raw_stream(self):
+        """Test read_mcp_message transparently wraps read()-only streams"""
+        payload = b'{"jsonrpc":"2.0","method":"ping","id":"1"}\n'
+        msg = await read_mcp_message(RawChunkReader(payload))
+
+        assert msg.method == "ping"
+        assert msg.id == "1"
+
+
+class TestMessagePool:
+    """Test message recycling in the streaming read path"""
+
+    @pytest.mark.asyncio
+    async def test_recycled_messages_are_reused(self):
+        """Test that recycled instances are refilled instead of reallocated"""
+        messages = [
+            '{"jsonrpc":"2.0","method":"search","id":"1"}\n',
+            '{"jsonrpc":"2.0","result":{"data":"test"},"id":"1"}\n',
+        ]
+        reader = AsyncReaderWriter("".join(messages).encode("utf-8"))
+        pool = MessagePool()
+
+        received = []
+        async for msg in read_mcp_messages(reader, pool=pool):
+            received.append((id(msg), msg.method, msg.result))
+            pool.recycle(msg)  # ↳ consumer is done, hand it back
+
+        assert len(received) == 2
+        # Same object, refilled in place for the second frame
+        assert received[0][0] == received[1][0]
+        assert received[0][1] == "search"
+        assert received[1][2] == {"data": "test"}
+
+    @pytest.mark.asyncio
+    async def test_without_pool_each_message_is_distinct(self):
+        """Test default behavior still allocates a fresh message per frame"""
+        messages = [
+            '{"jsonrpc":"2.0","method":"search","id":"1"}\n',
+            '{"jsonrpc":"2.0","result":{"data":"test"},"id":"1"}\n',
+        ]
+        reader = AsyncReaderWriter("".join(messages).encode("utf-8"))
+
+        received = [msg async for msg in read_mcp_messages(reader)]
+
+        assert len(received) == 2
+        assert received[0] is not received[1]
+
+
+class TestLengthPrefixedFraming:
+    """Test the opt-in 4-byte length-prefixed frame variant"""
+
+    @staticmethod
+    def _feed(data: bytes):
+        """StreamReader pre-loaded with raw bytes (readexactly support)."""
+        import asyncio
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    def test_pack_frame_layout(self):
+        """Test that the header is the little-endian payload length"""
+        frame = pack_mcp_frame(create_request("search", {"q": "test"}, "1"))
+        length = int.from_bytes(frame[:4], "little")
+        assert length == len(frame) - 4
+        # Payload is plain JSON, no trailing newline needed
+        assert json.loads(frame[4:]) == {
+            "jsonrpc": "2.0",
+            "method": "search",
+            "params": {"q": "test"},
+            "id": "1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_frame_round_trip(self):
+        """Test pack/read round trip over a stream"""
+        original = create_response({"data": "test"}, "42")
+        reader = self._feed(pack_mcp_frame(original))
+
+        message = await read_mcp_frame(reader)
+
+        assert message.result == {"data": "test"}
+        assert message.id == "42"
+
+    @pytest.mark.asyncio
+    async def test_frame_too_long_rejected_before_read(self):
+        """Test the length cap rejects oversized frames from the header"""
+        # Header declares 2 MiB; no payload bytes should be required to fail
+        reader = self._feed((2 * 1024 * 1024).to_bytes(4, "little"))
+
+        with pytest.raises(MCPFramingError, match="Message too long"):
+            await read_mcp_frame(reader, max_length=1024 * 1024)
+
+    @pytest.mark.asyncio
+    async def test_truncated_frame_raises_connection_error(self):
+        """Test that a connection dying mid-frame surfaces as such"""
+        frame = pack_mcp_frame(create_request("search", {"q": "test"}, "1"))
+        reader = self._feed(frame[:-3])  # drop the tail of the payload
+
+        with pytest.raises(ConnectionError, match="Connection closed"):
+            await read_mcp_frame(reader)
+
+
 class TestJSONRPCErrorCodes:
     """Test JSON-RPC error code constants"""
 
@@ -3,13 +3,157 @@ Unit tests for the MCP Protocol Server.
 """
 
 import asyncio
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
+import contextlib
+import gc
+import socket
+from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from readwise_vector_db.mcp.framing import create_request, pack_mcp_message
-from readwise_vector_db.mcp.server import MCPServer, active_connections, handle_client
+from readwise_vector_db.mcp.server import (
+    MCPServer,
+    _handle_client_wrapper,
+    active_connections,
+    handle_client,
+)
+
+
+def _loads(frame):
+    """Parse one response frame's bytes directly with orjson.
+
+    Accepts the raw frame including its delimiter: rstrip the framing
+    whitespace at the bytes level rather than paying a .decode()/.strip()
+    str allocation per frame.
+    """
+    return orjson.loads(frame.rstrip(b"\r\n\t "))
+
+
+@contextlib.asynccontextmanager
+async def stream_pair():
+    """Connected StreamReader/StreamWriter pairs over a real socketpair.
+
+    Unlike the pure-Python shims below, these go through asyncio's
+    C-implemented buffered protocol, so handle_client exercises its real
+    write/drain path including the transport's high-water mark.
+    """
+    client_sock, server_sock = socket.socketpair()
+    client_reader, client_writer = await asyncio.open_connection(sock=client_sock)
+    server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+    try:
+        yield client_reader, client_writer, server_reader, server_writer
+    finally:
+        for writer in (client_writer, server_writer):
+            if not writer.is_closing():
+                writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+
+async def run_client_session(request_bytes):
+    """Drive handle_client over a socketpair and return the parsed frames."""
+    async with stream_pair() as (client_reader, client_writer, reader, writer):
+        client_writer.write(request_bytes)
+        await client_writer.drain()
+
+        # Read concurrently so a full socket buffer can never deadlock the
+        # server's drain against our own read
+        task = asyncio.create_task(handle_client(reader, writer))
+        payload = await client_reader.read()
+        await task
+
+    return [_loads(frame) for frame in payload.split(b"\n") if frame]
+
+
+# Request frames reused across tests, packed once at import; safe to share
+# because MockStreamReader and the socketpair only ever read the bytes
+_SEARCH_5_BYTES = pack_mcp_message(
+    create_request("search", {"q": "test query", "k": 5}, "123")
+)
+_SEARCH_20_BYTES = pack_mcp_message(
+    create_request("search", {"q": "test query", "k": 20}, "123")
+)
+_SEARCH_PLAIN_BYTES = pack_mcp_message(create_request("search", {"q": "test"}, "123"))
+
+_TWO_RESULTS = [
+    {"id": "1", "text": "Test result 1", "score": 0.9},
+    {"id": "2", "text": "Test result 2", "score": 0.8},
+]
+
+
+def _check_streamed_results(responses):
+    """Two result frames echoing the request id, in result order."""
+    assert len(responses) == 2
+    for index, response in enumerate(responses):
+        assert response["jsonrpc"] == "2.0"
+        assert response["id"] == "123"
+        assert response["result"] == _TWO_RESULTS[index]
+
+
+def _check_empty_result(responses):
+    """A single frame carrying an empty result array."""
+    (response,) = responses
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == "123"
+    assert response["result"] == []
+
+
+def _check_method_not_found(responses):
+    """A single -32601 error frame."""
+    (response,) = responses
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == "123"
+    assert response["error"]["code"] == -32601  # Method not found
+    assert "Method not supported" in response["error"]["message"]
+
+
+def _check_invalid_params(responses):
+    """A single -32602 error frame."""
+    (response,) = responses
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == "123"
+    assert response["error"]["code"] == -32602  # Invalid params
+    assert "Missing or invalid 'q' parameter" in response["error"]["message"]
+
+
+@pytest.fixture(autouse=True)
+def _isolate_connections():
+    """Restore active_connections to its pre-test membership.
+
+    Cheaper than a blanket clear() in setup_method -- nothing is touched
+    when a test never adds a connection -- and safe under pytest-xdist,
+    where clear() would stomp connections added by sibling tests.
+    """
+    before = set(active_connections)
+    yield
+    active_connections.difference_update(set(active_connections) - before)
+
+
+@pytest.fixture
+def mock_semantic_search(monkeypatch):
+    """semantic_search patched once via monkeypatch; set .results to stream.
+
+    One setattr per test instead of re-entering unittest.mock._patch's
+    __enter__/__exit__ in every body. Tests assign mock.results for the
+    common case or override mock.side_effect for custom generators.
+    """
+    mock = MagicMock()
+    mock.results = []
+
+    async def _generate():
+        for result in mock.results:
+            yield result
+
+    def _dispatch(*args, **kwargs):
+        if kwargs.get("stream", False):
+            # Use the exact same pattern as real semantic_search
+            return _generate()
+        return list(mock.results)
+
+    mock.side_effect = _dispatch
+    monkeypatch.setattr("readwise_vector_db.mcp.search_service.semantic_search", mock)
+    return mock
 
 
 class MockStreamReader:
@@ -35,19 +179,44 @@ class MockStreamReader:
 
 
 class MockStreamWriter:
-    def __init__(self):
-        self.written = []
+    def __init__(self, write_buffer_size=1):
+        # Single bytearray accumulator: extending in place avoids one list
+        # node per write and the b"".join the consumers paid afterwards
+        self.buffer = bytearray()
+        self.frame_count = 0
         self.closed = False
-        self._drain_delay = 0  # seconds
         self.drain_called = 0
+        self.write_buffer_size = write_buffer_size
+        self.write_buffer_limits = None
+        # handle_client consults transport.get_write_buffer_size() to skip
+        # needless drains; point the mock's transport back at itself
+        self.transport = self
+
+    @property
+    def frames(self):
+        """Accumulated frames, recovered with one newline split."""
+        return [frame for frame in bytes(self.buffer).split(b"\n") if frame]
+
+    def get_write_buffer_size(self):
+        return self.write_buffer_size
+
+    def set_write_buffer_limits(self, high=None, low=None):
+        self.write_buffer_limits = (high, low)
 
     def write(self, data):
-        self.written.append(data)
+        self.buffer.extend(data)
+        self.frame_count += 1
+
+    def writelines(self, frames):
+        for frame in frames:
+            self.buffer.extend(frame)
+            self.frame_count += 1
 
     async def drain(self):
+        # Count and yield to the loop; no wall-clock delay so the
+        # back-pressure test measures drains, not elapsed time
         self.drain_called += 1
-        if self._drain_delay:
-            await asyncio.sleep(self._drain_delay)
+        await asyncio.sleep(0)
 
     def close(self):
         self.closed = True
@@ -60,193 +229,69 @@ class MockStreamWriter:
             return ("127.0.0.1", 12345)
         return None
 
-    def set_drain_delay(self, seconds):
-        self._drain_delay = seconds
 
-
-@pytest.mark.asyncio
 class TestMCPServer:
     """Tests for the MCP Server"""
 
-    def setup_method(self):
-        # Clear active connections between tests
-        active_connections.clear()
-
-    async def test_handle_client_search(self):
-        """Test handling a basic search request"""
-        # Prepare a search request
-        search_msg = create_request("search", {"q": "test query", "k": 5}, "123")
-        search_bytes = pack_mcp_message(search_msg)
-
-        # Setup mocks
-        reader = MockStreamReader([search_bytes])
-        writer = MockStreamWriter()
-
-        # Mock the semantic_search function
-        mock_results = [
-            {"id": "1", "text": "Test result 1", "score": 0.9},
-            {"id": "2", "text": "Test result 2", "score": 0.8},
-        ]
-
-        # Create mock that returns appropriate objects based on stream parameter
-        async def _mock_search_generator():
-            for result in mock_results:
-                yield result
-
-        def mock_semantic_search(*args, **kwargs):
-            stream = kwargs.get("stream", False)
-            if stream:
-                # Use the exact same pattern as real semantic_search
-                search_gen = _mock_search_generator()
-                return search_gen
-            else:
-                # Return list directly for non-streaming
-                return mock_results
-
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search",
-        ) as mock_search:
-            mock_search.side_effect = mock_semantic_search
-            # Process the client request
-            await handle_client(reader, writer)
-
-            # Check search was called correctly
-            mock_search.assert_called_once_with(
-                "test query", 5, None, None, None, None, stream=True
-            )
-
-            # Check the responses
-            assert len(writer.written) == 2  # Two search results
-            assert writer.closed is True
-
-            # Verify response data
-            responses = []
-            for data in writer.written:
-                response_json = json.loads(data.decode().strip())
-                responses.append(response_json)
-
-            # Check first response
-            assert responses[0]["jsonrpc"] == "2.0"
-            assert responses[0]["id"] == "123"
-            assert responses[0]["result"]["id"] == "1"
-            assert responses[0]["result"]["text"] == "Test result 1"
-            assert responses[0]["result"]["score"] == 0.9
-
-            # Check second response
-            assert responses[1]["jsonrpc"] == "2.0"
-            assert responses[1]["id"] == "123"
-            assert responses[1]["result"]["id"] == "2"
-            assert responses[1]["result"]["text"] == "Test result 2"
-            assert responses[1]["result"]["score"] == 0.8
-
-    async def test_handle_client_invalid_method(self):
-        """Test handling invalid method requests"""
-        # Prepare an invalid method request
-        invalid_msg = create_request("invalid_method", {"q": "test"}, "123")
-        invalid_bytes = pack_mcp_message(invalid_msg)
-
-        # Setup mocks
-        reader = MockStreamReader([invalid_bytes])
-        writer = MockStreamWriter()
-
-        # Process the client request
-        await handle_client(reader, writer)
-
-        # Check the response (should be an error)
-        assert len(writer.written) == 1
-        assert writer.closed is True
-
-        # Parse response
-        response_json = json.loads(writer.written[0].decode().strip())
-
-        # Verify error
-        assert response_json["jsonrpc"] == "2.0"
-        assert response_json["id"] == "123"
-        assert "error" in response_json
-        assert response_json["error"]["code"] == -32601  # Method not found
-        assert "Method not supported" in response_json["error"]["message"]
-
-    async def test_handle_client_missing_params(self):
-        """Test handling requests with missing parameters"""
-        # Create request with empty params
-        empty_params_msg = create_request("search", {}, "123")
-        empty_params_bytes = pack_mcp_message(empty_params_msg)
-
-        # Setup mocks
-        reader = MockStreamReader([empty_params_bytes])
-        writer = MockStreamWriter()
-
-        # Process the client request
-        await handle_client(reader, writer)
-
-        # Check the response (should be an error)
-        assert len(writer.written) == 1
-        assert writer.closed is True
-
-        # Parse response
-        response_json = json.loads(writer.written[0].decode().strip())
-
-        # Verify error
-        assert response_json["jsonrpc"] == "2.0"
-        assert response_json["id"] == "123"
-        assert "error" in response_json
-        assert response_json["error"]["code"] == -32602  # Invalid params
-        assert "Missing or invalid 'q' parameter" in response_json["error"]["message"]
-
-    async def test_handle_client_no_results(self):
-        """Test handling a search with no results"""
-        # Prepare a search request
-        search_msg = create_request("search", {"q": "test query", "k": 5}, "123")
-        search_bytes = pack_mcp_message(search_msg)
-
-        # Setup mocks
-        reader = MockStreamReader([search_bytes])
-        writer = MockStreamWriter()
-
-        # Create a simpler mock using the exact pattern from real semantic_search
-        async def _mock_search_generator():
-            # Empty async generator - yield nothing but still be an async generator
-            if False:  # This makes it an async generator but yields nothing
-                yield {}
-
-        def mock_semantic_search(*args, **kwargs):
-            stream = kwargs.get("stream", False)
-            if stream:
-                # Use the exact same pattern as real semantic_search
-                search_gen = _mock_search_generator()
-                return search_gen
-            else:
-                # Return list directly for non-streaming
-                return []
-
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search",
-        ) as mock_search:
-            mock_search.side_effect = mock_semantic_search
-            # Process the client request
-            await handle_client(reader, writer)
-
-            # Check search was called
-            mock_search.assert_called_once()
-
-            # Check the empty response
-            assert len(writer.written) == 1
-            assert writer.closed is True
-
-            # Verify response data
-            response = json.loads(writer.written[0].decode().strip())
-            assert response["jsonrpc"] == "2.0"
-            assert response["id"] == "123"
-            assert response["result"] == []
-
-    async def test_handle_client_disconnection(self):
+    @pytest.mark.parametrize(
+        "method,params,mock_results,expected_call,check",
+        [
+            pytest.param(
+                "search",
+                {"q": "test query", "k": 5},
+                _TWO_RESULTS,
+                ("test query", 5, None, None, None, None),
+                _check_streamed_results,
+                id="search-results",
+            ),
+            pytest.param(
+                "search",
+                {"q": "test query", "k": 5},
+                [],
+                ("test query", 5, None, None, None, None),
+                _check_empty_result,
+                id="search-no-results",
+            ),
+            pytest.param(
+                "invalid_method",
+                {"q": "test"},
+                [],
+                None,
+                _check_method_not_found,
+                id="invalid-method",
+            ),
+            pytest.param(
+                "search",
+                {},
+                [],
+                None,
+                _check_invalid_params,
+                id="missing-params",
+            ),
+        ],
+    )
+    async def test_handle_client(
+        self, mock_semantic_search, method, params, mock_results, expected_call, check
+    ):
+        """One request/response matrix covering result, empty and error paths"""
+        request_bytes = pack_mcp_message(create_request(method, params, "123"))
+
+        mock_semantic_search.results = mock_results
+        # Process the client request over real streams
+        responses = await run_client_session(request_bytes)
+
+        if expected_call is not None:
+            mock_semantic_search.assert_called_once_with(*expected_call, stream=True)
+        else:
+            # Requests rejected before dispatch never reach the search layer
+            mock_semantic_search.assert_not_called()
+
+        check(responses)
+
+    async def test_handle_client_disconnection(self, mock_semantic_search):
         """Test handling client disconnection during streaming"""
-        # Prepare a search request
-        search_msg = create_request("search", {"q": "test query", "k": 5}, "123")
-        search_bytes = pack_mcp_message(search_msg)
-
         # Setup mocks
-        reader = MockStreamReader([search_bytes])
+        reader = MockStreamReader([_SEARCH_5_BYTES])
         writer = MockStreamWriter()
 
         # Create results (more than we'll send)
@@ -261,8 +306,6 @@ class TestMCPServer:
 
         # Create an async generator
         async def results_generator():
-            # Wait a little to simulate work
-            await asyncio.sleep(0.1)
             # Set EOF after the first result
             reader.set_eof(True)
             # Only yield the first result before client disconnects
@@ -271,139 +314,174 @@ class TestMCPServer:
             yield mock_results[1]
             yield mock_results[2]
 
-        mock_search = AsyncMock(return_value=results_generator())
+        # Custom generator: override the fixture's default dispatch
+        mock_semantic_search.side_effect = lambda *args, **kwargs: results_generator()
 
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search", mock_search
-        ):
-            # Process the client request
-            await handle_client(reader, writer)
+        # Process the client request
+        await handle_client(reader, writer)
 
-            # Check search was called
-            mock_search.assert_called_once()
+        # Check search was called
+        mock_semantic_search.assert_called_once()
 
-            # Should have written only one result before detecting EOF
-            assert len(writer.written) <= 1
-            assert writer.closed is True
+        # Should have written only one result before detecting EOF
+        assert writer.frame_count <= 1
+        assert writer.closed is True
 
-    async def test_back_pressure(self):
+    async def test_back_pressure(self, mock_semantic_search):
         """Test back-pressure handling with slow client"""
-        # Prepare a search request
-        search_msg = create_request("search", {"q": "test query", "k": 5}, "123")
-        search_bytes = pack_mcp_message(search_msg)
+        # Setup mocks: a non-empty transport buffer means drain must run
+        reader = MockStreamReader([_SEARCH_5_BYTES])
+        writer = MockStreamWriter(write_buffer_size=1)
 
-        # Setup mocks
-        reader = MockStreamReader([search_bytes])
-        writer = MockStreamWriter()
+        mock_semantic_search.results = [
+            {"id": "1", "text": "Result 1", "score": 0.9},
+            {"id": "2", "text": "Result 2", "score": 0.8},
+            {"id": "3", "text": "Result 3", "score": 0.7},
+        ]
 
-        # Set a delay in the writer's drain method to simulate back-pressure
-        writer.set_drain_delay(0.05)  # 50ms delay
+        # Process the client request
+        await handle_client(reader, writer)
 
-        # Create some test results
-        mock_results = [
+        # Results are batched: one drain per batch of up to 16 frames,
+        # so 3 results coalesce into a single writelines + drain
+        assert writer.drain_called == 1
+
+        # Verify we sent all results
+        assert writer.frame_count == 3
+        assert writer.closed is True
+
+    async def test_drain_skipped_when_buffer_empty(self, mock_semantic_search):
+        """Test that drain is skipped while the transport buffer is empty"""
+        # Empty transport buffer: the kernel accepted everything, so no
+        # drain suspension is needed
+        reader = MockStreamReader([_SEARCH_5_BYTES])
+        writer = MockStreamWriter(write_buffer_size=0)
+
+        mock_semantic_search.results = [
             {"id": "1", "text": "Result 1", "score": 0.9},
             {"id": "2", "text": "Result 2", "score": 0.8},
             {"id": "3", "text": "Result 3", "score": 0.7},
         ]
 
-        # Create mock that handles streaming
-        async def _mock_search_generator():
-            for result in mock_results:
-                yield result
-
-        def mock_semantic_search(*args, **kwargs):
-            stream = kwargs.get("stream", False)
-            if stream:
-                search_gen = _mock_search_generator()
-                return search_gen
-            else:
-                return mock_results
-
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search",
-        ) as mock_search:
-            mock_search.side_effect = mock_semantic_search
-            # Process the client request
-            await handle_client(reader, writer)
+        await handle_client(reader, writer)
 
-            # Check drain was called once per result for back-pressure
-            assert writer.drain_called == 3
+        # All results written, but no drain awaits were paid
+        assert writer.drain_called == 0
+        assert writer.frame_count == 3
 
-            # Verify we sent all results
-            assert len(writer.written) == 3
-            assert writer.closed is True
+    async def test_batch_boundary_flush(self, mock_semantic_search):
+        """Test that the streaming loop flushes at the batch boundary"""
+        # Setup mocks
+        reader = MockStreamReader([_SEARCH_20_BYTES])
+        writer = MockStreamWriter()
 
-    async def test_active_connections_tracking(self):
-        """Test that connections are properly tracked in active_connections"""
-        # Clear the active_connections set at the beginning
-        active_connections.clear()
+        # 20 results force one full 16-frame batch plus a trailing flush
+        mock_semantic_search.results = [
+            {"id": str(i), "text": f"Result {i}", "score": 0.9} for i in range(20)
+        ]
 
-        # Prepare a search request
-        search_msg = create_request("search", {"q": "test"}, "123")
-        search_bytes = pack_mcp_message(search_msg)
+        await handle_client(reader, writer)
 
-        # Setup mocks
-        reader = MockStreamReader([search_bytes])
+        # ceil(20 / 16) == 2 drains, all 20 frames written
+        assert writer.drain_called == 2
+        assert writer.frame_count == 20
+
+        # The accumulator is already contiguous: split once, then orjson
+        # parses each frame's bytes directly
+        responses = [_loads(frame) for frame in writer.frames]
+        assert [r["result"]["id"] for r in responses] == [str(i) for i in range(20)]
+
+    async def test_write_buffer_limits_raised(self, mock_semantic_search):
+        """The connection wrapper lifts the transport's high-water mark"""
+        reader = MockStreamReader([_SEARCH_5_BYTES])
         writer = MockStreamWriter()
 
-        # Manually add to active connections (this is what we're testing)
-        active_connections.add(writer)
-        assert len(active_connections) == 1
-        assert writer in active_connections
+        mock_semantic_search.results = _TWO_RESULTS
 
-        # Mock the semantic_search function and handle the client (which should remove the connection)
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search", return_value=[]
-        ):
-            # Process the client request
+        await _handle_client_wrapper(reader, writer)
+
+        # 1 MiB high / 256 KiB low, set before the first frame is written
+        assert writer.write_buffer_limits == (1 << 20, 256 * 1024)
+        assert writer.frame_count == 2
+
+    async def test_active_connections_tracking(self, mock_semantic_search):
+        """Test that connections are properly tracked in active_connections"""
+        async with stream_pair() as (_, client_writer, reader, writer):
+            client_writer.write(_SEARCH_PLAIN_BYTES)
+            await client_writer.drain()
+
+            # Manually add to active connections (this is what we're testing)
+            active_connections.add(writer)
+            assert len(active_connections) == 1
+            assert writer in active_connections
+
+            # Process the client request (which should remove the connection)
             await handle_client(reader, writer)
 
             # Verify connection was removed after handling
             assert len(active_connections) == 0
             assert writer not in active_connections
 
-    @pytest.mark.asyncio
+    async def test_active_connections_weakref(self):
+        """Dropping the last writer reference empties active_connections"""
+        writer = MockStreamWriter()
+        active_connections.add(writer)
+        assert len(active_connections) == 1
+
+        # active_connections holds the writer weakly, so releasing the only
+        # strong reference must drop the entry without an explicit discard
+        del writer
+        gc.collect()
+        assert len(active_connections) == 0
+
+    async def test_connection_cap(self, monkeypatch):
+        """Excess concurrent clients queue on the connection semaphore"""
+        server = MCPServer(max_connections=1)
+
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def fake_handle(reader, writer):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        monkeypatch.setattr("readwise_vector_db.mcp.server.handle_client", fake_handle)
+
+        tasks = [
+            asyncio.create_task(server._serve_client(None, None)) for _ in range(3)
+        ]
+        # Let all three tasks reach the semaphore; only one may proceed
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert in_flight == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        # The cap held for the whole burst: never more than one in flight
+        assert peak == 1
+
     async def test_server_start_stop(self):
-        """Test server startup and shutdown"""
-        # Create a mock server
-        with patch("asyncio.start_server") as mock_start_server:
-            server_mock = AsyncMock()
-            mock_start_server.return_value = server_mock
-
-            # Specify the behavior for close and wait_closed
-            server_mock.close.return_value = None
-            server_mock.wait_closed.return_value = None
-
-            # Create a socket mock
-            socket_mock = MagicMock()
-            socket_mock.getsockname.return_value = ("127.0.0.1", 8375)
-            server_mock.sockets = [socket_mock]
-
-            # Initialize server
-            server = MCPServer("127.0.0.1", 8375)
-
-            # Start the server
-            await server.start()
-
-            # Check server was started with correct params
-            # The server should now register the internal wrapper that tracks
-            # client handler tasks instead of the raw ``handle_client``
-            from readwise_vector_db.mcp.server import (
-                _handle_client_wrapper,  # pylint: disable=import-error
-            )
-
-            mock_start_server.assert_called_once_with(
-                _handle_client_wrapper, "127.0.0.1", 8375
-            )
-
-            # Shutdown the server
-            await server.shutdown()
-
-            # Verify server was closed
-            server_mock.close.assert_called_once()
-            server_mock.wait_closed.assert_called_once()
-
-    @pytest.mark.asyncio
+        """Test server startup and shutdown against a real socket"""
+        # Binding an ephemeral port and starting for real is sub-millisecond
+        # and cheaper than assembling the AsyncMock chain it replaces --
+        # while exercising the actual asyncio.Server lifecycle
+        server = MCPServer("127.0.0.1", 0)
+
+        await server.start()
+        assert server.server is not None
+        assert server.server.is_serving()
+        host, port = server.server.sockets[0].getsockname()[:2]
+        assert host == "127.0.0.1"
+        assert port != 0
+
+        await server.shutdown()
+        assert not server.server.is_serving()
+
     async def test_run_in_background(self):
         """Test the server's run_in_background context manager"""
         with (
@@ -411,15 +489,18 @@ class TestMCPServer:
             patch.object(MCPServer, "shutdown") as mock_shutdown,
         ):
 
+            started = asyncio.Event()
+            mock_start.side_effect = started.set
+
             server = MCPServer()
             async with server.run_in_background():
+                # Wait on the start signal instead of a wall-clock sleep
+                await started.wait()
+
                 # Inside the context block, server should be started
                 mock_start.assert_called_once()
                 mock_shutdown.assert_not_called()
 
-                # Do some work inside the context
-                await asyncio.sleep(0.1)
-
             # After exiting context block, server should be shut down
             mock_shutdown.assert_called_once()
 
@@ -427,8 +508,7 @@ class TestMCPServer:
 class TestServerIntegration:
     """Integration tests that test multiple components together"""
 
-    @pytest.mark.asyncio
-    async def test_search_integration(self):
+    async def test_search_integration(self, mock_semantic_search):
         """Integration test for search functionality through server handling"""
         # Create a real search request
         request_msg = create_request(
@@ -436,10 +516,6 @@ class TestServerIntegration:
         )
         request_bytes = pack_mcp_message(request_msg)
 
-        # Mock components
-        reader = MockStreamReader([request_bytes])
-        writer = MockStreamWriter()
-
         # Create fake search results
         mock_results = [
             {
@@ -454,41 +530,21 @@ class TestServerIntegration:
             }
         ]
 
-        # Create mock that returns appropriate objects based on stream parameter
-        async def _mock_search_generator():
-            for result in mock_results:
-                yield result
-
-        def mock_semantic_search(*args, **kwargs):
-            stream = kwargs.get("stream", False)
-            if stream:
-                search_gen = _mock_search_generator()
-                return search_gen
-            else:
-                return mock_results
-
-        # Patch the semantic search function
-        with patch(
-            "readwise_vector_db.mcp.search_service.semantic_search",
-        ) as mock_search:
-            mock_search.side_effect = mock_semantic_search
-
-            # Run the client handler
-            await handle_client(reader, writer)
+        mock_semantic_search.results = mock_results
 
-            # Verify we got a response
-            assert len(writer.written) == 1
+        # Run the client handler over real streams
+        responses = await run_client_session(request_bytes)
 
-            # Parse response
-            response_data = writer.written[0].decode().strip()
-            response = json.loads(response_data)
+        # Verify we got a response
+        assert len(responses) == 1
+        response = responses[0]
 
-            # Check core response structure
-            assert response["jsonrpc"] == "2.0"
-            assert response["id"] == "test-id-123"
+        # Check core response structure
+        assert response["jsonrpc"] == "2.0"
+        assert response["id"] == "test-id-123"
 
-            # Check result content
-            assert "result" in response
-            assert response["result"]["id"] == "highlight-1"
-            assert response["result"]["text"] == "This is a test highlight"
-            assert response["result"]["score"] == 0.95
+        # Check result content
+        assert "result" in response
+        assert response["result"]["id"] == "highlight-1"
+        assert response["result"]["text"] == "This is a test highlight"
+        assert response["result"]["score"] == 0.95
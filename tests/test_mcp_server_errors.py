@@ -1,5 +1,4 @@
-import json
-
+import orjson
 import pytest
 
 from readwise_vector_db.mcp.server import handle_client
@@ -59,7 +58,9 @@ async def test_parse_error_results_in_jsonrpc_parse_error():
     # One error response should have been written
     assert len(writer.written) == 1
 
-    msg_json = json.loads(writer.written[0].decode().rstrip("\n"))
+    # orjson parses the frame bytes directly -- no intermediate str
+    # allocations, and the same bytes path the server itself uses
+    msg_json = orjson.loads(writer.written[0].rstrip(b"\n"))
 
     assert msg_json["jsonrpc"] == "2.0"
     assert msg_json["id"] is None  # null in JSON
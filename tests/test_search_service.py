@@ -214,6 +214,37 @@ class TestSearchServiceExecution:
 
             assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_stream_search_returns_raw_generator(self):
+        """Test stream_search hands back the underlying async generator."""
+        mock_results = [
+            {"id": 1, "text": "Result 1", "score": 0.9},
+            {"id": 2, "text": "Result 2", "score": 0.8},
+        ]
+
+        async def mock_semantic_search(*args, **kwargs):
+            assert kwargs.get("stream") is True
+
+            async def async_gen():
+                for result in mock_results:
+                    yield result
+
+            return async_gen()
+
+        search_params = SearchParams("test query")
+
+        with patch(
+            "readwise_vector_db.mcp.search_service.semantic_search",
+            mock_semantic_search,
+        ):
+            results_gen = await SearchService.stream_search(search_params)
+            # Raw async generator: consumed directly, no passthrough wrapper
+            assert hasattr(results_gen, "__aiter__")
+            results = [result async for result in results_gen]
+
+            assert len(results) == 2
+            assert results[0]["id"] == 1
+
     @pytest.mark.asyncio
     async def test_execute_search_no_streaming(self):
         """Test search execution without streaming."""
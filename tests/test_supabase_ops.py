@@ -2,7 +2,6 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import pytest_asyncio
 
 # Test imports - these will be stubbed by conftest.py if needed
 try:
@@ -11,6 +10,7 @@ try:
     from readwise_vector_db.config import DatabaseBackend, Settings
     from readwise_vector_db.core.search import semantic_search
     from readwise_vector_db.db.supabase_ops import (
+        batched_vector_search,
         execute_vector_query,
         upsert_highlights_vectorized,
         vector_similarity_search,
@@ -78,16 +78,8 @@ def supabase_settings():
     return settings
 
 
-@pytest_asyncio.fixture
-async def mock_asyncpg_pool():
-    """Mock asyncpg connection pool."""
-    from unittest.mock import MagicMock
-
-    # Create a real mock pool that works with async context managers
-    pool = MagicMock()
-
-    # Mock connection
-    conn = AsyncMock()
+def _configure_mock_connection(conn):
+    """Apply the canonical query results to the shared mock connection."""
     conn.fetch.return_value = [
         {
             "id": "test-1",
@@ -112,16 +104,37 @@ async def mock_asyncpg_pool():
     }
     conn.executemany.return_value = None
 
-    # Create a proper async context manager mock
-    class AsyncContextManagerMock:
-        async def __aenter__(self):
-            return conn
 
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            return None
+@pytest.fixture(scope="session")
+def mock_asyncpg_pool():
+    """Mock asyncpg connection pool, built once and shared across tests.
+
+    The mock graph is not bound to any event loop, so a single instance
+    amortizes ~15 MagicMock/AsyncMock constructions across the module;
+    the autouse ``_reset_mock_pool`` fixture keeps call histories and
+    return values pristine between tests.
+    """
+    # Create a real mock pool that works with async context managers
+    pool = MagicMock()
 
-    # Mock pool.acquire() to return our async context manager
-    pool.acquire.return_value = AsyncContextManagerMock()
+    # Mock connection
+    conn = AsyncMock()
+    _configure_mock_connection(conn)
+
+    # AsyncMock implements __aenter__/__aexit__ natively, so acquire()
+    # hands back a configured mock instead of a hand-written class.
+    # __aexit__ must return something falsy or it would swallow
+    # exceptions raised inside the block.
+    acquire_cm = AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = False
+    pool.acquire.return_value = acquire_cm
+
+    # conn.transaction() must return a context manager synchronously,
+    # not a coroutine like AsyncMock attributes do by default
+    transaction_cm = AsyncMock()
+    transaction_cm.__aexit__.return_value = False
+    conn.transaction = MagicMock(return_value=transaction_cm)
 
     # Store connection reference for test access
     pool._mock_connection = conn
@@ -129,6 +142,38 @@ async def mock_asyncpg_pool():
     return pool
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_pool(mock_asyncpg_pool):
+    """Reset the shared pool's call history after each test.
+
+    Return values are re-applied rather than merely kept, so tests that
+    override them (e.g. ``fetch.return_value = []``) cannot leak into
+    their neighbours.
+    """
+    yield
+    mock_asyncpg_pool.reset_mock()
+    conn = mock_asyncpg_pool._mock_connection
+    conn.reset_mock()
+    _configure_mock_connection(conn)
+
+
+@pytest.fixture(autouse=True)
+def _patched_get_pool(monkeypatch, mock_asyncpg_pool):
+    """Route supabase_ops.get_pool at the shared mock pool for every test.
+
+    A single monkeypatch attribute write replaces the per-test
+    ``with patch(...)`` context managers; tests needing a bespoke pool
+    (e.g. retry scenarios) still override it locally.
+    """
+    if not SUPABASE_MODULES_AVAILABLE:  # pragma: no cover - import guard
+        return
+
+    async def _get_pool(*args, **kwargs):
+        return mock_asyncpg_pool
+
+    monkeypatch.setattr("readwise_vector_db.db.supabase_ops.get_pool", _get_pool)
+
+
 @pytest.mark.skipif(
     not SUPABASE_MODULES_AVAILABLE, reason="Supabase modules not available"
 )
@@ -191,47 +236,31 @@ class TestVectorQuery:
         self, mock_asyncpg_pool, mock_settings
     ):
         """Test executing vector query that fetches all results."""
+        results = await execute_vector_query(
+            "SELECT * FROM highlight",
+            params=["param1"],
+            fetch_all=True,
+            settings_obj=mock_settings,
+        )
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
-
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
-        ):
-            results = await execute_vector_query(
-                "SELECT * FROM highlight",
-                params=["param1"],
-                fetch_all=True,
-                settings_obj=mock_settings,
-            )
-
-            assert len(results) == 1
-            assert results[0]["id"] == "test-1"
+        assert len(results) == 1
+        assert results[0]["id"] == "test-1"
 
-            # Verify pool was called correctly
-            mock_asyncpg_pool.acquire.assert_called_once()
+        # Verify pool was called correctly
+        mock_asyncpg_pool.acquire.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_vector_query_fetch_one(
         self, mock_asyncpg_pool, mock_settings
     ):
         """Test executing vector query that fetches one result."""
+        result = await execute_vector_query(
+            "SELECT * FROM highlight LIMIT 1",
+            fetch_all=False,
+            settings_obj=mock_settings,
+        )
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
-
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
-        ):
-            result = await execute_vector_query(
-                "SELECT * FROM highlight LIMIT 1",
-                fetch_all=False,
-                settings_obj=mock_settings,
-            )
-
-            assert result["id"] == "test-1"
+        assert result["id"] == "test-1"
 
     @pytest.mark.asyncio
     async def test_execute_vector_query_with_retry(self, mock_settings):
@@ -253,15 +282,11 @@ class TestVectorQuery:
 
         conn.fetch = mock_fetch
 
-        # Create proper async context manager
-        class AsyncContextManagerMock:
-            async def __aenter__(self):
-                return conn
-
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
-
-        pool.acquire.return_value = AsyncContextManagerMock()
+        # AsyncMock natively supports the async context manager protocol
+        acquire_cm = AsyncMock()
+        acquire_cm.__aenter__.return_value = conn
+        acquire_cm.__aexit__.return_value = False
+        pool.acquire.return_value = acquire_cm
 
         async def mock_get_pool(*args, **kwargs):
             return pool
@@ -287,24 +312,20 @@ class TestVectorizedUpsert:
     @pytest.mark.asyncio
     async def test_upsert_highlights_vectorized(self, mock_asyncpg_pool, mock_settings):
         """Test vectorized upsert of highlights."""
+        processed_count = await upsert_highlights_vectorized(
+            SAMPLE_HIGHLIGHTS,
+            batch_size=2,
+            settings_obj=mock_settings,
+        )
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
-
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
-        ):
-            processed_count = await upsert_highlights_vectorized(
-                SAMPLE_HIGHLIGHTS,
-                batch_size=2,
-                settings_obj=mock_settings,
-            )
-
-            assert processed_count == 2
+        assert processed_count == 2
 
-            # Verify executemany was called with correct data
-            mock_asyncpg_pool._mock_connection.executemany.assert_called()
+        # Verify the single UNNEST execute carried the whole batch
+        conn = mock_asyncpg_pool._mock_connection
+        conn.execute.assert_called_once()
+        query_sql = conn.execute.call_args[0][0]
+        assert "unnest" in query_sql.lower()
+        assert "ON CONFLICT (id) DO UPDATE" in query_sql
 
     @pytest.mark.asyncio
     async def test_upsert_empty_list(self, mock_settings):
@@ -326,24 +347,79 @@ class TestVectorizedUpsert:
             highlight["id"] = f"test-{i}"
             large_dataset.append(highlight)
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
+        processed_count = await upsert_highlights_vectorized(
+            large_dataset,
+            batch_size=100,
+            settings_obj=mock_settings,
+        )
 
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
-        ):
-            processed_count = await upsert_highlights_vectorized(
-                large_dataset,
-                batch_size=100,
-                settings_obj=mock_settings,
-            )
+        assert processed_count == 250
+
+        # Should have been called 3 times (2 full batches + 1 partial),
+        # one UNNEST execute per batch rather than one per row
+        conn = mock_asyncpg_pool._mock_connection
+        assert conn.execute.call_count == 3
+
+        # Each execute binds twelve parallel column arrays sized to
+        # its batch
+        first_call_params = conn.execute.call_args_list[0][0][1:]
+        assert len(first_call_params) == 12
+        assert len(first_call_params[0]) == 100
+
+    def test_upsert_sql_generated_once(self):
+        """Test the upsert SQL is a stable module-level constant."""
+        from readwise_vector_db.db import supabase_ops
+
+        # A stable string lets asyncpg key its statement cache on it
+        assert isinstance(supabase_ops._UPSERT_UNNEST_SQL, str)
+        assert "ON CONFLICT (id) DO UPDATE" in supabase_ops._UPSERT_UNNEST_SQL
+
+    def test_itemgetter_used_for_transpose(self):
+        """Test row flattening goes through the C-level itemgetter."""
+        import operator
+
+        from readwise_vector_db.db import supabase_ops
 
-            assert processed_count == 250
+        assert isinstance(supabase_ops._SCALAR_FIELDS_GETTER, operator.itemgetter)
 
-            # Should have been called 3 times (2 full batches + 1 partial)
-            conn = mock_asyncpg_pool._mock_connection
-            assert conn.executemany.call_count == 3
+        row = supabase_ops._highlight_row(SAMPLE_HIGHLIGHTS[0])
+        assert len(row) == 12
+        assert row[0] == "test-1"
+        # Array columns are rendered as Postgres literals for in-SQL casts
+        assert row[10].startswith("{")
+        assert row[11].startswith("[")
+
+    @pytest.mark.asyncio
+    async def test_upsert_uses_copy(self, mock_asyncpg_pool, mock_settings):
+        """Test that use_copy streams each batch via COPY into staging."""
+        large_dataset = []
+        for i in range(250):
+            highlight = SAMPLE_HIGHLIGHTS[0].copy()
+            highlight["id"] = f"test-{i}"
+            large_dataset.append(highlight)
+
+        processed_count = await upsert_highlights_vectorized(
+            large_dataset,
+            batch_size=100,
+            settings_obj=mock_settings,
+            use_copy=True,
+        )
+
+        assert processed_count == 250
+
+        # One COPY per batch, carrying every tuple of that batch
+        conn = mock_asyncpg_pool._mock_connection
+        assert conn.copy_records_to_table.call_count == 3
+        copied = sum(
+            len(call.kwargs["records"])
+            for call in conn.copy_records_to_table.call_args_list
+        )
+        assert copied == 250
+
+        # The merge statement applies upsert semantics from staging
+        merge_sqls = [call[0][0] for call in conn.execute.call_args_list]
+        assert any("highlight_staging" in sql for sql in merge_sqls)
+        assert any("ON CONFLICT (id) DO UPDATE" in sql for sql in merge_sqls)
 
 
 @pytest.mark.skipif(
@@ -355,69 +431,103 @@ class TestVectorSimilaritySearch:
     @pytest.mark.asyncio
     async def test_vector_similarity_search(self, mock_asyncpg_pool, mock_settings):
         """Test basic vector similarity search."""
+        results = []
+        async for result in vector_similarity_search(
+            query_embedding=SAMPLE_EMBEDDING,
+            k=5,
+            settings_obj=mock_settings,
+        ):
+            results.append(result)
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
+        assert len(results) == 1
+        assert results[0]["id"] == "test-1"
+        assert "score" in results[0]
 
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
+    @pytest.mark.asyncio
+    async def test_hnsw_ef_search_tuned(self, mock_asyncpg_pool, mock_settings):
+        """Test the HNSW candidate queue is widened per query."""
+        conn = mock_asyncpg_pool._mock_connection
+
+        async for _ in vector_similarity_search(
+            query_embedding=SAMPLE_EMBEDDING,
+            k=5,
+            settings_obj=mock_settings,
         ):
-            results = []
-            async for result in vector_similarity_search(
-                query_embedding=SAMPLE_EMBEDDING,
-                k=5,
-                settings_obj=mock_settings,
-            ):
-                results.append(result)
+            pass
 
-            assert len(results) == 1
-            assert results[0]["id"] == "test-1"
-            assert "score" in results[0]
+        # Small k keeps pgvector's floor of 40
+        conn.execute.assert_called_once_with("SET LOCAL hnsw.ef_search = 40")
+        # SET LOCAL only applies inside the transaction it shares with
+        # the fetch
+        conn.transaction.assert_called_once()
+
+        conn.reset_mock()
+
+        async for _ in vector_similarity_search(
+            query_embedding=SAMPLE_EMBEDDING,
+            k=30,
+            settings_obj=mock_settings,
+        ):
+            pass
+
+        # Larger k widens the queue to 2*k
+        conn.execute.assert_called_once_with("SET LOCAL hnsw.ef_search = 60")
 
     @pytest.mark.asyncio
-    async def test_vector_search_with_filters(self, mock_asyncpg_pool, mock_settings):
-        """Test vector search with source type and author filters."""
+    async def test_batched_search_ef_search_tuned(
+        self, mock_asyncpg_pool, mock_settings
+    ):
+        """Test the batched path widens the scan like the single path."""
+        conn = mock_asyncpg_pool._mock_connection
+        conn.fetch.return_value = []
 
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
+        await batched_vector_search(
+            [SAMPLE_EMBEDDING, SAMPLE_EMBEDDING], [5, 30], settings_obj=mock_settings
+        )
 
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
+        # SET LOCAL spans the whole batch transaction, so the widest
+        # query in the batch governs: max(2 * 30, 40)
+        conn.execute.assert_called_once_with("SET LOCAL hnsw.ef_search = 60")
+        conn.transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_vector_search_with_filters(self, mock_asyncpg_pool, mock_settings):
+        """Test vector search with source type and author filters."""
+        results = []
+        async for result in vector_similarity_search(
+            query_embedding=SAMPLE_EMBEDDING,
+            k=5,
+            source_type="article",
+            author="Test Author",
+            tags=["ai", "ml"],
+            settings_obj=mock_settings,
         ):
-            results = []
-            async for result in vector_similarity_search(
-                query_embedding=SAMPLE_EMBEDDING,
-                k=5,
-                source_type="article",
-                author="Test Author",
-                tags=["ai", "ml"],
-                settings_obj=mock_settings,
-            ):
-                results.append(result)
+            results.append(result)
 
-            assert len(results) == 1
+        assert len(results) == 1
 
-            # Verify query includes WHERE conditions
-            conn = mock_asyncpg_pool._mock_connection
-            conn.fetch.assert_called_once()
+        # Verify query includes WHERE conditions
+        conn = mock_asyncpg_pool._mock_connection
+        conn.fetch.assert_called_once()
 
-            # Get the call arguments
-            call_args = conn.fetch.call_args
-            query_sql = call_args[0][0]
-            query_params = call_args[0][1:]
+        # Get the call arguments
+        call_args = conn.fetch.call_args
+        query_sql = call_args[0][0]
+        query_params = call_args[0][1:]
 
-            # Verify filters are in SQL
-            assert "source_type = $2" in query_sql
-            assert "source_author = $3" in query_sql
-            assert "tags && $4" in query_sql
+        # Verify filters are pushed into the candidates CTE so the
+        # distance operator only scans the filtered subset
+        assert "WITH candidates" in query_sql
+        assert "source_type = $2" in query_sql
+        assert "source_author = $3" in query_sql
+        assert "tags && $4" in query_sql
+        assert query_sql.index("source_type = $2") < query_sql.index("ORDER BY")
 
-            # Verify parameters
-            assert SAMPLE_EMBEDDING in query_params
-            assert "article" in query_params
-            assert "Test Author" in query_params
-            assert ["ai", "ml"] in query_params
+        # Verify parameters
+        assert SAMPLE_EMBEDDING in query_params
+        assert "article" in query_params
+        assert "Test Author" in query_params
+        assert ["ai", "ml"] in query_params
 
 
 @pytest.mark.skipif(
@@ -460,6 +570,190 @@ class TestSemanticSearchIntegration:
             # Verify Supabase ops were used
             mock_vector_search.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_pool_warmup_overlaps_embedding(self, supabase_settings):
+        """Test embedding and pool warm-up run concurrently, not serially."""
+        import time
+
+        from readwise_vector_db.core import search as search_module
+
+        search_module._embed_cache.clear()
+        delay = 0.05
+
+        async def slow_embed(*args, **kwargs):
+            await asyncio.sleep(delay)
+            return SAMPLE_EMBEDDING
+
+        async def slow_get_pool(*args, **kwargs):
+            await asyncio.sleep(delay)
+            return MagicMock()
+
+        async def mock_search_gen(*args, **kwargs):
+            yield {"id": "test-1", "text": "test", "score": 0.1}
+
+        with (
+            patch("readwise_vector_db.core.search.get_openai_client") as mock_client,
+            patch("readwise_vector_db.core.search.embed", slow_embed),
+            patch("readwise_vector_db.core.search.get_pool", slow_get_pool),
+            patch(
+                "readwise_vector_db.core.search.vector_similarity_search"
+            ) as mock_vector_search,
+        ):
+            mock_client.return_value = AsyncMock()
+            mock_vector_search.side_effect = lambda *a, **kw: mock_search_gen()
+
+            start = time.monotonic()
+            results = await semantic_search(
+                query="warmup overlap query",
+                k=5,
+                use_supabase_ops=True,
+                settings_obj=supabase_settings,
+            )
+            elapsed = time.monotonic() - start
+
+            assert len(results) == 1
+            # Both legs sleep `delay`; overlapped execution stays well
+            # under the 2 * delay a serial implementation would take
+            assert elapsed < 1.8 * delay
+
+        search_module._embed_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_embedding_cache_hit(self, supabase_settings):
+        """Test that repeated queries reuse the cached embedding."""
+        from readwise_vector_db.core import search as search_module
+
+        search_module._embed_cache.clear()
+
+        with (
+            patch("readwise_vector_db.core.search.get_openai_client") as mock_client,
+            patch("readwise_vector_db.core.search.embed") as mock_embed,
+            patch(
+                "readwise_vector_db.core.search.vector_similarity_search"
+            ) as mock_vector_search,
+        ):
+            mock_client.return_value = AsyncMock()
+            mock_embed.return_value = SAMPLE_EMBEDDING
+
+            async def mock_search_gen(*args, **kwargs):
+                yield {"id": "test-1", "text": "test", "score": 0.1}
+
+            mock_vector_search.side_effect = lambda *a, **kw: mock_search_gen()
+
+            for _ in range(2):
+                results = await semantic_search(
+                    query="cached query",
+                    k=5,
+                    use_supabase_ops=True,
+                    settings_obj=supabase_settings,
+                )
+                assert len(results) == 1
+
+            # Second call skips the embedding API round-trip entirely
+            assert mock_embed.call_count == 1
+
+        search_module._embed_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_micro_batching(self, supabase_settings):
+        """Test concurrent unfiltered searches share one Postgres query."""
+        from readwise_vector_db.core import search as search_module
+
+        search_module._embed_cache.clear()
+
+        with (
+            patch("readwise_vector_db.core.search.get_openai_client") as mock_client,
+            patch("readwise_vector_db.core.search.embed") as mock_embed,
+            patch(
+                "readwise_vector_db.core.search.batched_vector_search"
+            ) as mock_batched,
+        ):
+            mock_client.return_value = AsyncMock()
+            mock_embed.return_value = SAMPLE_EMBEDDING
+            mock_batched.side_effect = lambda embeddings, ks, settings_obj=None: [
+                [{"id": f"test-{i}", "text": "test", "score": 0.1}]
+                for i in range(len(embeddings))
+            ]
+
+            all_results = await asyncio.gather(
+                *[
+                    semantic_search(
+                        query=f"batched query {i}",
+                        k=5,
+                        use_supabase_ops=True,
+                        settings_obj=supabase_settings,
+                    )
+                    for i in range(10)
+                ]
+            )
+
+            assert all(len(results) == 1 for results in all_results)
+
+            # All ten searches collapsed into a single batched query
+            mock_batched.assert_called_once()
+            assert len(mock_batched.call_args[0][0]) == 10
+
+        search_module._embed_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_micro_batching_groups_by_settings(self, supabase_settings):
+        """Test a caller's query never runs under another caller's settings."""
+        from readwise_vector_db.core import search as search_module
+
+        batcher = search_module._SearchBatcher()
+        other_settings = MagicMock(spec=Settings)
+        other_settings.db_backend = DatabaseBackend.SUPABASE
+        other_settings.is_serverless = True
+
+        with patch(
+            "readwise_vector_db.core.search.batched_vector_search"
+        ) as mock_batched:
+            mock_batched.side_effect = lambda embeddings, ks, settings_obj=None: [
+                [] for _ in embeddings
+            ]
+
+            await asyncio.gather(
+                batcher.search(SAMPLE_EMBEDDING, 5, supabase_settings),
+                batcher.search(SAMPLE_EMBEDDING, 5, supabase_settings),
+                batcher.search(SAMPLE_EMBEDDING, 5, other_settings),
+            )
+
+        # One batched query per distinct settings object in the flush
+        assert mock_batched.call_count == 2
+        called_settings = [
+            call.kwargs["settings_obj"] for call in mock_batched.call_args_list
+        ]
+        assert supabase_settings in called_settings
+        assert other_settings in called_settings
+
+    @pytest.mark.asyncio
+    async def test_micro_batching_survives_loop_change(self, supabase_settings):
+        """Test stale loop-bound state cannot deadlock a fresh loop's callers."""
+        from readwise_vector_db.core import search as search_module
+
+        batcher = search_module._SearchBatcher()
+
+        # Simulate state left behind by a previous event loop
+        stale_loop = asyncio.new_event_loop()
+        stale_future = stale_loop.create_future()
+        batcher._loop = stale_loop
+        batcher._pending = [(SAMPLE_EMBEDDING, 5, supabase_settings, stale_future)]
+        stale_loop.close()
+
+        with patch(
+            "readwise_vector_db.core.search.vector_similarity_search"
+        ) as mock_search:
+
+            async def mock_search_gen(*args, **kwargs):
+                yield {"id": "test-1", "text": "test", "score": 0.1}
+
+            mock_search.side_effect = lambda *a, **kw: mock_search_gen()
+
+            results = await batcher.search(SAMPLE_EMBEDDING, 5, supabase_settings)
+
+        assert results == [{"id": "test-1", "text": "test", "score": 0.1}]
+        assert batcher._loop is asyncio.get_running_loop()
+
     @pytest.mark.asyncio
     async def test_semantic_search_fallback_to_sqlmodel(self, mock_settings):
         """Test that semantic search falls back to SQLModel for local deployments."""
@@ -593,6 +887,34 @@ class TestPostgres14Compatibility:
         # For now, we verify our sample data has the right dimensions
         assert len(SAMPLE_EMBEDDING) == 3072  # text-embedding-3-large dimensions
 
+        # Int8 quantization keeps the dimensionality and stays inside
+        # the symmetric int8 range
+        from readwise_vector_db.core.quantize import quantize_int8
+
+        quantized = quantize_int8(SAMPLE_EMBEDDING)
+        assert len(quantized) == 3072
+        assert all(-127 <= component <= 127 for component in quantized)
+
+    def test_quantization_round_trip(self):
+        """Test int8 quantization approximates the original vector."""
+        from readwise_vector_db.core.quantize import dequantize_int8, quantize_int8
+
+        original = [0.5, -1.25, 3.0, 0.0]
+        peak = max(abs(value) for value in original)
+
+        quantized = quantize_int8(original)
+        assert quantized[2] == 127  # the peak component saturates
+        assert quantized[3] == 0
+
+        restored = dequantize_int8(quantized, peak)
+        step = peak / 127  # one quantization step
+        for before, after in zip(original, restored, strict=True):
+            assert abs(before - after) <= step
+
+        # Degenerate inputs stay well-defined
+        assert quantize_int8([]) == []
+        assert quantize_int8([0.0, 0.0]) == [0, 0]
+
 
 # Performance and edge case tests
 @pytest.mark.skipif(
@@ -604,46 +926,32 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_empty_embedding_list(self, mock_asyncpg_pool, mock_settings):
         """Test handling of empty embedding."""
-
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
-
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
+        results = []
+        async for result in vector_similarity_search(
+            query_embedding=[],  # Empty embedding
+            k=5,
+            settings_obj=mock_settings,
         ):
-            results = []
-            async for result in vector_similarity_search(
-                query_embedding=[],  # Empty embedding
-                k=5,
-                settings_obj=mock_settings,
-            ):
-                results.append(result)
+            results.append(result)
 
-            # Should handle gracefully
-            assert isinstance(results, list)
+        # Should handle gracefully
+        assert isinstance(results, list)
 
     @pytest.mark.asyncio
     async def test_zero_k_parameter(self, mock_asyncpg_pool, mock_settings):
         """Test handling of k=0."""
-        mock_asyncpg_pool._mock_connection.fetch.return_value = []
-
-        async def mock_get_pool(*args, **kwargs):
-            return mock_asyncpg_pool
-
-        with patch(
-            "readwise_vector_db.db.supabase_ops.get_pool",
-            side_effect=mock_get_pool,
+        results = []
+        async for result in vector_similarity_search(
+            query_embedding=SAMPLE_EMBEDDING,
+            k=0,
+            settings_obj=mock_settings,
         ):
-            results = []
-            async for result in vector_similarity_search(
-                query_embedding=SAMPLE_EMBEDDING,
-                k=0,
-                settings_obj=mock_settings,
-            ):
-                results.append(result)
+            results.append(result)
+
+        assert len(results) == 0
 
-            assert len(results) == 0
+        # A non-positive limit short-circuits before any round-trip
+        mock_asyncpg_pool._mock_connection.fetch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_network_timeout_retry(self, mock_settings):
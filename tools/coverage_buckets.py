@@ -7,84 +7,172 @@ This module defines which modules require different levels of test coverage:
 - Standard modules: 60% coverage (supportive or volatile)
 """
 
-from pathlib import Path
-from typing import List
-
-# ↳ Core modules containing business-critical logic - require 90% coverage
-CORE_MODULES: List[str] = [
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+# ↳ Core modules containing business-critical logic - require 90% coverage.
+# Listed in descending expected hit frequency (file count per package),
+# so cold classifications exit the prefix scan as early as possible
+CORE_MODULES: Tuple[str, ...] = (
     "readwise_vector_db/core",  # embedding.py, search.py, readwise.py
-    "readwise_vector_db/db",  # database.py, upsert.py, supabase_ops.py
     "readwise_vector_db/models",  # all model files
-]
+    "readwise_vector_db/db",  # database.py, upsert.py, supabase_ops.py
+)
 
 # ↳ High-priority modules that are important but stable - require 75% coverage
-HIGH_PRIORITY_MODULES: List[str] = [
+HIGH_PRIORITY_MODULES: Tuple[str, ...] = (
     "readwise_vector_db/api",  # FastAPI routes and main
     "readwise_vector_db/jobs",  # sync jobs (backfill, incremental)
-]
+)
 
 # ↳ Standard modules for supportive or volatile components - require 60% coverage
-STANDARD_MODULES: List[str] = [
+STANDARD_MODULES: Tuple[str, ...] = (
     "readwise_vector_db/mcp",  # MCP server implementation
     "readwise_vector_db/config",  # configuration management
     "readwise_vector_db/main",  # CLI entry points
-]
+)
+
+# ↳ Interned bucket-name singletons: every classification returns one of
+# these exact objects, so downstream dict lookups and comparisons hit
+# the identity fast path and no per-call string is ever allocated
+_BUCKET_CORE = sys.intern("core")
+_BUCKET_HIGH = sys.intern("high_priority")
+_BUCKET_STD = sys.intern("standard")
+_BUCKET_UNKNOWN = sys.intern("unknown")
 
 # ↳ Coverage thresholds for each bucket
 COVERAGE_THRESHOLDS = {
-    "core": 90,  # Business-critical modules
-    "high_priority": 75,  # Important but stable modules
-    "standard": 60,  # Supportive or volatile modules
+    _BUCKET_CORE: 90,  # Business-critical modules
+    _BUCKET_HIGH: 75,  # Important but stable modules
+    _BUCKET_STD: 60,  # Supportive or volatile modules
 }
 
 
-def normalize_module_path(module_path: str) -> str:
+def normalize_module_path(module_path: str, _is_win: bool = os.sep == "\\") -> str:
     """
     Normalize a module path to use forward slashes consistently.
 
     This ensures compatibility across different operating systems and
-    consistent matching with coverage report paths.
+    consistent matching with coverage report paths. A plain str.replace
+    does everything the previous Path(...).as_posix() round-trip did
+    here, without allocating and parsing a Path per call. On Windows,
+    where the filesystem is case-insensitive and coverage tools emit
+    mixed-case drive letters, the path is lowercased as well; the
+    platform check is bound once at definition time via the default
+    argument rather than re-evaluated per call.
     """
-    return str(Path(module_path).as_posix())
+    if _is_win:
+        module_path = module_path.lower()
+    return module_path.replace("\\", "/")
 
 
+def _build_prefix_trie() -> dict:
+    """
+    Compile the bucket prefix lists into a path-segment trie.
+
+    Interior pattern segments become exact dict lookups; each pattern's
+    final segment matches either a directory of that exact name or a
+    module file named after it (so the pattern ``.../config`` matches
+    ``.../config.py`` but not ``.../config_extra.py``), stored as a
+    ``(segment, segment + ".", bucket)`` triple under the ``""`` key of
+    its parent node with the dotted form precomputed here. Walking a
+    file path is then O(depth) dict lookups plus one short match list at
+    the matching node, instead of a linear scan over every bucket
+    pattern per file. Buckets are inserted in priority order so an
+    earlier bucket wins ties.
+    """
+    trie: dict = {"": []}
+    buckets = [
+        (_BUCKET_CORE, CORE_MODULES),
+        (_BUCKET_HIGH, HIGH_PRIORITY_MODULES),
+        (_BUCKET_STD, STANDARD_MODULES),
+    ]
+    for bucket, modules in buckets:
+        for module in modules:
+            *parents, leaf = normalize_module_path(module).split("/")
+            node = trie
+            for segment in parents:
+                node = node.setdefault(segment, {"": []})
+            node[""].append((leaf, leaf + ".", bucket))
+    return trie
+
+
+_TRIE = _build_prefix_trie()
+
+
+@lru_cache(maxsize=4096)
 def get_module_bucket(file_path: str) -> str:
     """
     Determine which coverage bucket a file belongs to.
 
+    Walks the precompiled path-segment trie, so classification cost is
+    proportional to the path depth rather than the total number of
+    bucket patterns. The result is memoized since paths repeat across
+    callers.
+
     Args:
         file_path: Path to the source file (e.g., "readwise_vector_db/core/embedding.py")
 
     Returns:
         Bucket name: "core", "high_priority", "standard", or "unknown"
     """
-    normalized_path = normalize_module_path(file_path)
-
-    # Check each bucket in priority order
-    for module in CORE_MODULES:
-        if normalized_path.startswith(normalize_module_path(module)):
-            return "core"
+    node = _TRIE
+    for segment in normalize_module_path(file_path).split("/"):
+        for leaf, leaf_dot, bucket in node[""]:
+            # Match the directory itself or a module file named after
+            # it, but not lookalikes sharing only a string prefix
+            if segment == leaf or segment.startswith(leaf_dot):
+                return bucket
+        next_node = node.get(segment)
+        if next_node is None:
+            return _BUCKET_UNKNOWN
+        node = next_node
+
+    return _BUCKET_UNKNOWN
+
+
+def get_buckets_for_files(file_paths: Iterable[str]) -> Dict[str, str]:
+    """
+    Classify many file paths in one pass.
 
-    for module in HIGH_PRIORITY_MODULES:
-        if normalized_path.startswith(normalize_module_path(module)):
-            return "high_priority"
+    Binds the memoized scalar lookup to a local once so a large coverage
+    report pays no repeated global loads, and duplicate paths collapse
+    straight to cache hits.
 
-    for module in STANDARD_MODULES:
-        if normalized_path.startswith(normalize_module_path(module)):
-            return "standard"
+    Args:
+        file_paths: Paths to classify
 
-    return "unknown"
+    Returns:
+        Mapping of each path to its bucket name
+    """
+    classify = get_module_bucket
+    return {file_path: classify(file_path) for file_path in file_paths}
 
 
+@lru_cache(maxsize=4096)
 def get_threshold_for_file(file_path: str) -> int:
     """
     Get the coverage threshold for a specific file.
 
+    Pure and repeatedly called with the same paths, so memoized like
+    :func:`get_module_bucket`.
+
     Args:
         file_path: Path to the source file
 
     Returns:
         Coverage threshold percentage (90, 75, 60, or 70 for unknown)
     """
+    # get_module_bucket returns interned singletons, so a pointer-compare
+    # chain replaces the dict hash; COVERAGE_THRESHOLDS remains the
+    # declarative source these branches mirror
     bucket = get_module_bucket(file_path)
-    return COVERAGE_THRESHOLDS.get(bucket, 70)  # Default 70% for unknown files
+    if bucket is _BUCKET_CORE:
+        return 90
+    if bucket is _BUCKET_HIGH:
+        return 75
+    if bucket is _BUCKET_STD:
+        return 60
+    return 70  # Default for unknown files